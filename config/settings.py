@@ -6,6 +6,7 @@ import json
 import os
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 @dataclass(slots=True)
@@ -47,11 +48,11 @@ def _load_json(
         return default or {}
     try:
         parsed = json.loads(value)
-        if not isinstance(parsed, dict):
-            raise ValueError
-        return {str(k): str(v) for k, v in parsed.items()}
-    except ValueError as exc:  # noqa: PERF203 - trata entrada malformada
+    except json.JSONDecodeError as exc:
         raise RuntimeError("Variável de ambiente de seletores inválida") from exc
+    if not isinstance(parsed, dict):
+        raise RuntimeError("Variável de ambiente de seletores inválida")
+    return {str(k): str(v) for k, v in parsed.items()}
 
 
 def _load_tags(value: str | None) -> Sequence[str]:
@@ -66,30 +67,68 @@ def _load_tags(value: str | None) -> Sequence[str]:
     return tuple(tag.strip() for tag in value.split(",") if tag.strip())
 
 
+_ENV_KEYS = (
+    "FAROL_LISTING_URL",
+    "FAROL_LISTING_ITEM_KEY",
+    "FAROL_PARSER_SELECTORS",
+    "FAROL_MONGODB_URI",
+    "FAROL_MONGODB_DB",
+    "FAROL_MONGODB_COLLECTION",
+    "FAROL_DEFAULT_TAGS",
+    "FAROL_FALLBACK_TITLE",
+)
+
+
 def load_settings() -> Settings:
-    """Carrega configurações a partir de variáveis de ambiente."""
+    """Carrega configurações a partir de variáveis de ambiente.
+
+    O resultado é memoizado por combinação de valores das variáveis lidas;
+    use :func:`clear_settings_cache` para forçar releitura em testes.
+    """
+
+    return _build_settings(tuple(os.environ.get(key) for key in _ENV_KEYS))
+
+
+def clear_settings_cache() -> None:
+    """Descarta as configurações memoizadas."""
+
+    _build_settings.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _build_settings(values: tuple[str | None, ...]) -> Settings:
+    (
+        listing_url,
+        item_key,
+        parser_selectors,
+        mongo_uri,
+        mongo_db,
+        mongo_collection,
+        default_tags,
+        fallback_title,
+    ) = values
 
     http = HttpSettings(
-        listing_url=os.environ.get("FAROL_LISTING_URL", "https://example.com/listing"),
-        item_key=os.environ.get("FAROL_LISTING_ITEM_KEY", "items"),
+        listing_url=listing_url or "https://example.com/listing",
+        item_key=item_key or "items",
     )
 
     parser = ParserSettings(
         selectors=_load_json(
-            os.environ.get("FAROL_PARSER_SELECTORS"),
+            parser_selectors,
             default={"title": "h1", "body": "article"},
         )
     )
 
     database = DatabaseSettings(
-        uri=os.environ.get("FAROL_MONGODB_URI", "mongodb://localhost:27017"),
-        name=os.environ.get("FAROL_MONGODB_DB", "farol"),
-        collection=os.environ.get("FAROL_MONGODB_COLLECTION", "articles"),
+        uri=mongo_uri or "mongodb://localhost:27017",
+        name=mongo_db or "farol",
+        collection=mongo_collection or "articles",
     )
 
     application = ApplicationSettings(
-        default_tags=_load_tags(os.environ.get("FAROL_DEFAULT_TAGS")),
-        fallback_title=os.environ.get("FAROL_FALLBACK_TITLE", "Sem título"),
+        default_tags=_load_tags(default_tags),
+        fallback_title=fallback_title or "Sem título",
     )
 
     return Settings(
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from array import array
+from collections import ChainMap
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from logging import Logger
+from datetime import datetime
+from functools import partial
+from hashlib import blake2b
+from logging import INFO, Logger
+from sys import intern
+from types import MappingProxyType
 
 from farol_core.domain.contracts import (
     ArticleInput,
@@ -19,8 +26,58 @@ from farol_core.domain.contracts import (
 )
 from farol_core.domain.errors import FarolError
 
-
-@dataclass(slots=True)
+_WRITE_BATCH_SIZE = 500
+
+# Chaves internadas dos dicts montados no laço por item: comparação de
+# ponteiro em vez de comparação de string nos lookups.
+_K_URL = intern("url")
+_K_REASON = intern("reason")
+_K_EXTRA = intern("extra")
+_K_PAGE_INDEX = intern("page_index")
+_K_POSITION = intern("position")
+_K_FINGERPRINT = intern("fingerprint")
+_K_ARTICLE_ID = intern("article_id")
+_K_STATUS = intern("status")
+_K_PROCESSED_AT = intern("processed_at")
+
+
+class BloomSeen:
+    """Filtro de Bloom compacto para deduplicação de URLs em coletas longas.
+
+    Mantém memória constante (~1,2 MB para 1M de URLs a ~1% de falsos
+    positivos) em vez do custo por entrada de um ``set[str]``. Falsos
+    positivos apenas causam um descarte extra, o que é aceitável para o
+    caminho de dedup.
+    """
+
+    _HASH_COUNT = 3
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacidade do filtro deve ser positiva")
+        # ~9,6 bits por entrada para ~1% FPR com k=3.
+        self._bit_count = max(capacity * 10, 64)
+        self._words = array("Q", bytes(8 * ((self._bit_count + 63) // 64)))
+
+    def add_if_absent(self, value: str) -> bool:
+        """Registra ``value`` e retorna ``True`` se provavelmente era inédito."""
+
+        digest = blake2b(value.encode("utf-8"), digest_size=16).digest()
+        base = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        absent = False
+        words = self._words
+        bit_count = self._bit_count
+        for round_ in range(self._HASH_COUNT):
+            bit = (base + round_ * step) % bit_count
+            word_index, mask = bit >> 6, 1 << (bit & 63)
+            if not words[word_index] & mask:
+                absent = True
+                words[word_index] |= mask
+        return absent
+
+
+@dataclass(slots=True, frozen=True)
 class ScrapedItem:
     """Representa o conteúdo cru retornado pelo scraper de páginas."""
 
@@ -56,179 +113,379 @@ class CollectUseCase:
         writer: ArticleWriter,
         clock: Clock,
         logger: Logger,
+        url_seen_capacity: int | None = None,
+        max_workers: int = 1,
     ) -> None:
         self._scraper = scraper
         self._pages = tuple(pages)
+        # Páginas são constantes durante a execução: resolve URL e metadados
+        # uma única vez em vez de uma vez por página a cada execute().
+        self._page_info = tuple(
+            (
+                page,
+                str(page.get("url")),
+                MappingProxyType(dict(self._to_metadata(page.get("metadata")))),
+            )
+            for page in self._pages
+        )
         self._url_normalizer = url_normalizer
         self._date_normalizer = date_normalizer
         self._text_cleaner = text_cleaner
+        # Métodos usados uma vez por item em _build_article, pré-ligados para
+        # evitar a cadeia de atributos por chamada.
+        self._sanitize_html = text_cleaner.sanitize_html
+        self._clean_text = text_cleaner.clean_html_to_text
+        self._parse_date = date_normalizer.parse
         self._deduper = deduper
         self._writer = writer
         self._clock = clock
         self._logger = logger
+        self._url_seen_capacity = url_seen_capacity
+        self._max_workers = max_workers
 
     def execute(self) -> Mapping[str, object]:
         """Executa o fluxo de coleta retornando métricas e itens persistidos."""
 
         seen_urls: set[str] = set()
+        seen_filter = (
+            BloomSeen(self._url_seen_capacity)
+            if self._url_seen_capacity is not None
+            else None
+        )
+        skipped = {"url": 0, "invalid": 0, "fingerprint": 0, "write": 0}
         metrics: dict[str, object] = {
             "processed": 0,
-            "skipped": defaultdict(int),
+            "skipped": skipped,
             "pages": {"total": len(self._pages), "fetched": 0},
         }
+        skipped_url = skipped_invalid = skipped_fingerprint = 0
+        processed = 0
+        pages_fetched = 0
         persisted: list[Mapping[str, object]] = []
+        pending: list[tuple[ArticleInput, str, int, int]] = []
+
+        started = self._clock.now()
+        started_iso = started.isoformat()
+
+        # Liga métodos usados no laço quente a locais (LOAD_FAST vs LOAD_ATTR).
+        to_absolute = self._url_normalizer.to_absolute
+        fingerprint_of = self._deduper.fingerprint
+        is_new = self._deduper.is_new
+        pre_fingerprint = getattr(self._deduper, "pre_fingerprint", None)
+        log_info = self._logger.info
+        log_error = self._logger.error
+        info_on = self._info_enabled()
+        seen_add = seen_urls.add
 
         self._logger.info(
             "scrape.start",
             extra={
-                "extra": {
-                    "at": self._clock.now().isoformat(),
+                _K_EXTRA: {
+                    "at": started_iso,
                     "pages": len(self._pages),
                 }
             },
         )
 
-        for page_index, page in enumerate(self._pages, start=1):
-            page_url = str(page.get("url"))
-            page_metadata = self._to_metadata(page.get("metadata"))
+        executor: ThreadPoolExecutor | None = None
+        if self._max_workers > 1 and len(self._page_info) > 1:
+            executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            producers: Sequence[Callable[[], Iterable[ScrapedItem]]] = [
+                executor.submit(self._scraper.fetch_page, info[0]).result
+                for info in self._page_info
+            ]
+        else:
+            producers = [
+                partial(self._scraper.fetch_page, info[0])
+                for info in self._page_info
+            ]
+
+        try:
+            for page_index, (_, page_url, page_metadata) in enumerate(
+                self._page_info, start=1
+            ):
+                fetched_count = 0
+                try:
+                    items = iter(producers[page_index - 1]())
+                except FarolError:
+                    self._logger.exception(
+                        "scrape.page_error",
+                        extra={_K_EXTRA: {_K_URL: page_url, "index": page_index}},
+                    )
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    self._logger.exception(
+                        "scrape.page_unexpected",
+                        extra={_K_EXTRA: {_K_URL: page_url, "index": page_index}},
+                    )
+                    raise FarolError("Erro inesperado durante a coleta", cause=exc) from exc
+
+                for position, item in self._iter_page_items(
+                    items, page_url=page_url, page_index=page_index
+                ):
+                    fetched_count += 1
+                    normalized_url = to_absolute(item.url, page_url)
+                    if (
+                        not seen_filter.add_if_absent(normalized_url)
+                        if seen_filter is not None
+                        else normalized_url in seen_urls
+                    ):
+                        skipped_url += 1
+                        if info_on:
+                            log_info(
+                                "scrape.item_skipped_dedup",
+                                extra={
+                                    _K_EXTRA: {
+                                        _K_URL: normalized_url,
+                                        _K_REASON: _K_URL,
+                                        _K_PAGE_INDEX: page_index,
+                                        _K_POSITION: position,
+                                    }
+                                },
+                            )
+                        continue
+
+                    if seen_filter is None:
+                        seen_add(normalized_url)
+
+                    if pre_fingerprint is not None and not is_new(
+                        pre_fingerprint(normalized_url, item.content_html)
+                    ):
+                        skipped_fingerprint += 1
+                        if info_on:
+                            log_info(
+                                "scrape.item_skipped_dedup",
+                                extra={
+                                    _K_EXTRA: {
+                                        _K_URL: normalized_url,
+                                        _K_REASON: _K_FINGERPRINT,
+                                        _K_PAGE_INDEX: page_index,
+                                        _K_POSITION: position,
+                                    }
+                                },
+                            )
+                        continue
+
+                    try:
+                        article = self._build_article(
+                            item,
+                            normalized_url=normalized_url,
+                            page_metadata=page_metadata,
+                            collected_at=started,
+                            collected_at_iso=started_iso,
+                        )
+                    except FarolError as exc:
+                        skipped_invalid += 1
+                        log_error(
+                            "scrape.item_failed",
+                            extra={
+                                _K_EXTRA: {
+                                    _K_URL: normalized_url,
+                                    _K_REASON: exc.__class__.__name__,
+                                    _K_PAGE_INDEX: page_index,
+                                    _K_POSITION: position,
+                                }
+                            },
+                        )
+                        continue
+
+                    fingerprint = fingerprint_of(article)
+                    if not is_new(fingerprint):
+                        skipped_fingerprint += 1
+                        if info_on:
+                            log_info(
+                                "scrape.item_skipped_dedup",
+                                extra={
+                                    _K_EXTRA: {
+                                        _K_URL: normalized_url,
+                                        _K_REASON: _K_FINGERPRINT,
+                                        _K_PAGE_INDEX: page_index,
+                                        _K_POSITION: position,
+                                    }
+                                },
+                            )
+                        continue
+
+                    pending.append((article, fingerprint, page_index, position))
+                    if len(pending) >= _WRITE_BATCH_SIZE:
+                        processed += self._flush_pending(
+                            pending, metrics, persisted, started_iso
+                        )
+
+                pages_fetched += 1
+                self._logger.info(
+                    "scrape.page_fetched",
+                    extra={
+                        _K_EXTRA: {
+                            _K_URL: page_url,
+                            "index": page_index,
+                            "count": fetched_count,
+                        }
+                    },
+                )
+
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        processed += self._flush_pending(pending, metrics, persisted, started_iso)
+
+        metrics["processed"] = processed
+        metrics["pages"]["fetched"] = pages_fetched
+        skipped["url"] += skipped_url
+        skipped["invalid"] += skipped_invalid
+        skipped["fingerprint"] += skipped_fingerprint
+        metrics["skipped"] = {key: count for key, count in skipped.items() if count}
+        result = {"metrics": metrics, "items": persisted}
+        self._logger.info(
+            "scrape.finish",
+            extra={
+                _K_EXTRA: {
+                    "at": self._clock.now().isoformat(),
+                    "processed": metrics["processed"],
+                    "skipped": metrics["skipped"],
+                }
+            },
+        )
+        return result
+
+    def _info_enabled(self) -> bool:
+        is_enabled_for = getattr(self._logger, "isEnabledFor", None)
+        if is_enabled_for is None:
+            return True
+        return bool(is_enabled_for(INFO))
+
+    def _iter_page_items(
+        self,
+        items: Iterable[ScrapedItem],
+        *,
+        page_url: str,
+        page_index: int,
+    ) -> Iterable[tuple[int, ScrapedItem]]:
+        """Itera itens da página preservando o tratamento de erros do fetch."""
+
+        iterator = enumerate(items, start=1)
+        while True:
             try:
-                items = list(self._scraper.fetch_page(page))
+                entry = next(iterator)
+            except StopIteration:
+                return
             except FarolError:
                 self._logger.exception(
                     "scrape.page_error",
-                    extra={"extra": {"url": page_url, "index": page_index}},
+                    extra={_K_EXTRA: {_K_URL: page_url, "index": page_index}},
                 )
                 raise
             except Exception as exc:  # noqa: BLE001
                 self._logger.exception(
                     "scrape.page_unexpected",
-                    extra={"extra": {"url": page_url, "index": page_index}},
+                    extra={_K_EXTRA: {_K_URL: page_url, "index": page_index}},
                 )
                 raise FarolError("Erro inesperado durante a coleta", cause=exc) from exc
+            yield entry
 
-            metrics["pages"]["fetched"] += 1
-            self._logger.info(
-                "scrape.page_fetched",
-                extra={
-                    "extra": {
-                        "url": page_url,
-                        "index": page_index,
-                        "count": len(items),
-                    }
-                },
-            )
-
-            for position, item in enumerate(items, start=1):
-                normalized_url = self._url_normalizer.to_absolute(item.url, page_url)
-                if normalized_url in seen_urls:
-                    metrics["skipped"]["url"] += 1
-                    self._logger.info(
-                        "scrape.item_skipped_dedup",
-                        extra={
-                            "extra": {
-                                "url": normalized_url,
-                                "reason": "url",
-                                "page_index": page_index,
-                                "position": position,
-                            }
-                        },
-                    )
-                    continue
-
-                seen_urls.add(normalized_url)
-
-                try:
-                    article = self._build_article(
-                        item,
-                        normalized_url=normalized_url,
-                        page_metadata=page_metadata,
-                    )
-                except FarolError as exc:
-                    metrics["skipped"]["invalid"] += 1
-                    self._logger.error(
-                        "scrape.item_failed",
-                        extra={
-                            "extra": {
-                                "url": normalized_url,
-                                "reason": exc.__class__.__name__,
-                                "page_index": page_index,
-                                "position": position,
-                            }
-                        },
-                    )
-                    continue
-
-                fingerprint = self._deduper.fingerprint(article)
-                if not self._deduper.is_new(fingerprint):
-                    metrics["skipped"]["fingerprint"] += 1
-                    self._logger.info(
-                        "scrape.item_skipped_dedup",
-                        extra={
-                            "extra": {
-                                "url": normalized_url,
-                                "reason": "fingerprint",
-                                "page_index": page_index,
-                                "position": position,
-                            }
-                        },
-                    )
-                    continue
-
-                try:
-                    write_result: ArticleWriteResult = self._writer.write(article, fingerprint)
-                except FarolError as exc:
-                    metrics["skipped"]["write"] += 1
-                    self._logger.error(
-                        "scrape.item_failed",
-                        extra={
-                            "extra": {
-                                "url": normalized_url,
-                                "reason": exc.__class__.__name__,
-                                "page_index": page_index,
-                                "position": position,
-                            }
-                        },
+    def _flush_pending(
+        self,
+        pending: list[tuple[ArticleInput, str, int, int]],
+        metrics: MutableMapping[str, object],
+        persisted: list[Mapping[str, object]],
+        processed_at: str,
+    ) -> int:
+        if not pending:
+            return 0
+        flushed = 0
+        write_many = getattr(self._writer, "write_many", None)
+        if write_many is not None:
+            try:
+                results = write_many([(article, fp) for article, fp, _, _ in pending])
+            except FarolError as exc:
+                for article, _, page_index, position in pending:
+                    self._record_write_failure(
+                        metrics, article.url, exc, page_index, position
                     )
-                    continue
-
-                metrics["processed"] += 1
-                processed_at = self._clock.now().isoformat()
-                persisted.append(
-                    {
-                        "url": article.url,
-                        "article_id": write_result.article_id,
-                        "fingerprint": fingerprint,
-                        "status": write_result.status,
-                        "processed_at": processed_at,
-                    }
+                pending.clear()
+                return 0
+            for entry, write_result in zip(pending, results, strict=True):
+                article, fingerprint, page_index, position = entry
+                self._record_persisted(
+                    article, fingerprint, write_result, page_index, position,
+                    persisted=persisted, processed_at=processed_at,
                 )
-                self._logger.info(
-                    "scrape.item_persisted",
-                    extra={
-                        "extra": {
-                            "url": article.url,
-                            "article_id": write_result.article_id,
-                            "fingerprint": fingerprint,
-                            "status": write_result.status,
-                            "page_index": page_index,
-                            "position": position,
-                        }
-                    },
+                flushed += 1
+            pending.clear()
+            return flushed
+
+        for article, fingerprint, page_index, position in pending:
+            try:
+                write_result = self._writer.write(article, fingerprint)
+            except FarolError as exc:
+                self._record_write_failure(
+                    metrics, article.url, exc, page_index, position
                 )
+                continue
+            self._record_persisted(
+                article, fingerprint, write_result, page_index, position,
+                persisted=persisted, processed_at=processed_at,
+            )
+            flushed += 1
+        pending.clear()
+        return flushed
 
-        metrics["skipped"] = dict(metrics["skipped"])
-        result = {"metrics": metrics, "items": persisted}
+    def _record_write_failure(
+        self,
+        metrics: MutableMapping[str, object],
+        url: str,
+        exc: FarolError,
+        page_index: int,
+        position: int,
+    ) -> None:
+        metrics["skipped"]["write"] += 1
+        self._logger.error(
+            "scrape.item_failed",
+            extra={
+                _K_EXTRA: {
+                    _K_URL: url,
+                    _K_REASON: exc.__class__.__name__,
+                    _K_PAGE_INDEX: page_index,
+                    _K_POSITION: position,
+                }
+            },
+        )
+
+    def _record_persisted(
+        self,
+        article: ArticleInput,
+        fingerprint: str,
+        write_result: ArticleWriteResult,
+        page_index: int,
+        position: int,
+        *,
+        persisted: list[Mapping[str, object]],
+        processed_at: str,
+    ) -> None:
+        persisted.append(
+            {
+                _K_URL: article.url,
+                _K_ARTICLE_ID: write_result.article_id,
+                _K_FINGERPRINT: fingerprint,
+                _K_STATUS: write_result.status,
+                _K_PROCESSED_AT: processed_at,
+            }
+        )
+        if not self._info_enabled():
+            return
         self._logger.info(
-            "scrape.finish",
+            "scrape.item_persisted",
             extra={
-                "extra": {
-                    "at": self._clock.now().isoformat(),
-                    "processed": metrics["processed"],
-                    "skipped": metrics["skipped"],
+                _K_EXTRA: {
+                    _K_URL: article.url,
+                    _K_ARTICLE_ID: write_result.article_id,
+                    _K_FINGERPRINT: fingerprint,
+                    _K_STATUS: write_result.status,
+                    _K_PAGE_INDEX: page_index,
+                    _K_POSITION: position,
                 }
             },
         )
-        return result
 
     def _build_article(
         self,
@@ -236,26 +493,32 @@ class CollectUseCase:
         *,
         normalized_url: str,
         page_metadata: Mapping[str, object],
+        collected_at: datetime,
+        collected_at_iso: str,
     ) -> ArticleInput:
-        collected_at = self._clock.now()
         content_html = item.content_html or ""
         if not content_html:
             raise FarolError("Artigo sem conteúdo")
 
-        sanitized_html = self._text_cleaner.sanitize_html(content_html)
-        content_text = self._text_cleaner.clean_html_to_text(content_html)
+        sanitized_html = self._sanitize_html(content_html)
+        content_text = self._clean_text(content_html)
         summary_source = item.summary_html if item.summary_html is not None else content_html
-        summary_text = self._text_cleaner.clean_html_to_text(summary_source)
+        summary_text = self._clean_text(summary_source)
         summary_value = summary_text or None
 
         title = item.title or summary_text or "Sem título"
 
         published_at = None
         if item.published_at:
-            published_at = self._date_normalizer.parse(item.published_at, reference=None)
-
-        combined_metadata: dict[str, object] = {**page_metadata, **item.metadata}
-        combined_metadata.setdefault("normalized_at", collected_at.isoformat())
+            published_at = self._parse_date(item.published_at, reference=None)
+
+        combined_metadata: MutableMapping[str, object]
+        if item.metadata:
+            combined_metadata = {**page_metadata, **item.metadata}
+        else:
+            # Caso comum: sem metadados por item, evita copiar o dict da página.
+            combined_metadata = ChainMap({}, page_metadata)
+        combined_metadata.setdefault("normalized_at", collected_at_iso)
 
         portal_name = str(
             combined_metadata.get("portal_name")
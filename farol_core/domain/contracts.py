@@ -2,23 +2,36 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Literal
 from typing import Protocol
 
+# Tuplas de tags idênticas compartilham um único objeto: em coletas com
+# poucos conjuntos distintos de tags, cada artigo passa a carregar só uma
+# referência em vez de uma tupla própria.
+_TAG_TUPLE_CACHE: dict[tuple[str, ...], tuple[str, ...]] = {}
 
-@dataclass(slots=True)
+
+def _intern_tags(tags: Sequence[str]) -> tuple[str, ...]:
+    key = tuple(
+        sys.intern(tag) if type(tag) is str else tag for tag in tags
+    )
+    return _TAG_TUPLE_CACHE.setdefault(key, key)
+
+
+@dataclass(slots=True, frozen=True)
 class RawListingItem:
     """Item bruto retornado pelo coletor da listagem principal."""
 
     url: str
-    content: str
+    content: str | bytes | None = None
     metadata: MutableMapping[str, object] = field(default_factory=dict)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RawArticle:
     """Artigo bruto após o parsing do conteúdo HTML."""
 
@@ -28,7 +41,7 @@ class RawArticle:
     metadata: MutableMapping[str, object] = field(default_factory=dict)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ArticleInput:
     """Entrada canônica para persistir um artigo normalizado."""
 
@@ -44,6 +57,15 @@ class ArticleInput:
     collected_at: datetime
     metadata: Mapping[str, object] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # portal_name e tags se repetem ao longo de uma coleta inteira;
+        # internar na construção troca corpos de string duplicados por
+        # referências compartilhadas e torna comparações em dedup e
+        # agregações comparações de ponteiro.
+        if type(self.portal_name) is str:
+            object.__setattr__(self, "portal_name", sys.intern(self.portal_name))
+        object.__setattr__(self, "tags", _intern_tags(self.tags))
+
 
 @dataclass(slots=True)
 class ArticleWriteResult:
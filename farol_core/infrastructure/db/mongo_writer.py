@@ -2,78 +2,363 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime, timezone
 from typing import Any
+from uuid import uuid4
 
 from farol_core.domain.contracts import ArticleInput, ArticleWriteResult, ArticleWriter
 from farol_core.domain.errors import WriteError
 
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    from pymongo import UpdateOne
+    from pymongo.errors import BulkWriteError
+except Exception:  # noqa: BLE001 - degradar para escrita unitária
+    UpdateOne = None
+    BulkWriteError = None
+
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import bson
+    from bson.binary import Binary
+except Exception:  # noqa: BLE001 - degradar para raw_meta como dict
+    bson = None
+    Binary = None
+
+_DUPLICATE_KEY_CODE = 11000
+_UTC = timezone.utc
+
 
 class MongoArticleWriter(ArticleWriter):
-    """Implementação de ``ArticleWriter`` para MongoDB."""
+    """Implementação de ``ArticleWriter`` para MongoDB.
+
+    Espera um índice único em ``url`` (e um índice simples em
+    ``fingerprint``) para que upserts e o fallback de duplicidade sejam
+    buscas indexadas; ambos são criados na construção quando a coleção
+    suporta ``create_index``.
+    """
 
-    def __init__(self, collection: Any) -> None:
+    def __init__(
+        self,
+        collection: Any,
+        *,
+        encode_raw_meta: bool = False,
+        staging_merge: bool = False,
+        fold_duplicate_content: bool = False,
+    ) -> None:
         self._collection = collection
+        # Opt-in: serializa raw_meta para um blob BSON único em vez de
+        # deixar o driver codificar o dict aninhado campo a campo; sem
+        # bson instalado o dict plano segue sendo gravado.
+        self._encode_raw_meta = encode_raw_meta and bson is not None
+        # Opt-in: quando o HTML é a mesma string do texto, grava
+        # ``content_html`` como None e marca ``content_is_html`` — o
+        # ``content_text`` dobra como HTML. Só habilite quando os
+        # leitores da coleção souberem reidratar o campo.
+        self._fold_duplicate_content = fold_duplicate_content
+        # Opt-in: lotes de ``write_many`` passam pelo caminho de staging +
+        # ``$merge`` (ver ``flush_staging``) em vez do ``bulk_write``. O
+        # ``$merge`` não distingue inserções de atualizações, então os
+        # resultados reportam tudo como "updated".
+        self._staging_merge = staging_merge
+        self._ensure_indexes()
+
+    @property
+    def collection(self) -> Any:
+        """Coleção subjacente, exposta para integrações como o warm-up
+        de fingerprints do deduper."""
+
+        return self._collection
+
+    def _ensure_indexes(self) -> None:
+        create_index = getattr(self._collection, "create_index", None)
+        if create_index is None:
+            return
+        try:
+            create_index([("url", 1)], unique=True, background=True)
+            create_index([("fingerprint", 1)], background=True)
+        except Exception:  # noqa: BLE001, S110 - coleção sem suporte/permissão
+            pass
 
     def write(self, article: ArticleInput, fingerprint: str) -> ArticleWriteResult:
+        """Persiste um artigo em uma única ida ao MongoDB.
+
+        O filtro ``$or`` casa tanto pelo ``url`` quanto pelo
+        ``fingerprint``, então a colisão de chave que antes exigia um
+        segundo ``update_one`` de fallback é resolvida na mesma operação.
+        Erros remanescentes (ex.: url e fingerprint apontando para
+        documentos distintos) viram ``WriteError``.
+        """
+
         document = self._to_document(article, fingerprint)
+        filter_doc = {"$or": [{"url": article.url}, {"fingerprint": fingerprint}]}
+
+        reply = self._fast_upsert(filter_doc, document)
+        if reply is not None:
+            upserted = reply.get("upserted")
+            if upserted:
+                return ArticleWriteResult(
+                    status="inserted", article_id=str(upserted[0].get("_id"))
+                )
+            return ArticleWriteResult(status="updated")
+
         try:
             result = self._collection.update_one(
-                {"url": article.url},
+                filter_doc,
                 {"$set": document},
                 upsert=True,
             )
         except Exception as exc:  # noqa: BLE001
-            if exc.__class__.__name__ != "DuplicateKeyError":
-                raise WriteError("Falha ao escrever artigo no MongoDB", cause=exc) from exc
-
-            try:
-                fallback_result = self._collection.update_one(
-                    {"fingerprint": fingerprint},
-                    {"$set": document},
-                    upsert=False,
-                )
-            except Exception as inner_exc:  # noqa: BLE001
-                raise WriteError(
-                    "Falha ao atualizar artigo duplicado por fingerprint no MongoDB",
-                    cause=inner_exc,
-                ) from inner_exc
+            raise WriteError("Falha ao escrever artigo no MongoDB", cause=exc) from exc
+
+        if getattr(result, "upserted_id", None) is not None:
+            return ArticleWriteResult(status="inserted", article_id=str(result.upserted_id))
+
+        return ArticleWriteResult(status="updated")
+
+    def _fast_upsert(
+        self, filter_doc: Mapping[str, Any], document: Mapping[str, Any]
+    ) -> Mapping[str, Any] | None:
+        """Executa o upsert via comando ``update`` cru quando possível.
+
+        Ler a resposta do comando direto como dict evita que o driver
+        construa um ``UpdateResult`` por escrita; coleções sem banco/nome
+        expostos (dobles de teste) devolvem ``None`` e seguem pelo
+        ``update_one`` tradicional.
+        """
+
+        database = getattr(self._collection, "database", None)
+        name = getattr(self._collection, "name", None)
+        command = getattr(database, "command", None) if database is not None else None
+        if command is None or name is None:
+            return None
+        try:
+            reply = command(
+                "update",
+                name,
+                updates=[{"q": filter_doc, "u": {"$set": document}, "upsert": True}],
+                ordered=False,
+            )
+        except Exception as exc:  # noqa: BLE001
+            raise WriteError("Falha ao escrever artigo no MongoDB", cause=exc) from exc
+        if reply.get("writeErrors"):
+            raise WriteError(
+                f"Falha ao escrever artigo no MongoDB: {reply['writeErrors']}"
+            )
+        return reply
+
+    def write_many(
+        self, pairs: Sequence[tuple[ArticleInput, str]]
+    ) -> list[ArticleWriteResult]:
+        """Persiste um lote de artigos em uma única ida ao MongoDB.
+
+        Usa ``bulk_write`` com ``ordered=False`` para que o servidor processe
+        os upserts em paralelo; apenas entradas com chave duplicada são
+        reprocessadas individualmente pelo caminho de fallback de ``write``.
+        """
 
-            if getattr(fallback_result, "matched_count", 0) == 0:
+        if not pairs:
+            return []
+        if self._staging_merge:
+            staging = self._staging_collection()
+            if staging is not None:
+                self._merge_through_staging(staging, self._to_documents_batch(pairs))
+                return [ArticleWriteResult(status="updated") for _ in pairs]
+        if UpdateOne is None or not hasattr(self._collection, "bulk_write"):
+            return [self.write(article, fingerprint) for article, fingerprint in pairs]
+
+        documents = self._to_documents_batch(pairs)
+        # Mesmo filtro $or de ``write``: um artigo cuja url mudou mas cujo
+        # fingerprint já existe é atualizado em vez de duplicado (o índice
+        # de fingerprint não é único, então nenhum erro de chave duplicada
+        # acionaria o fallback).
+        operations = [
+            UpdateOne(
+                {
+                    "$or": [
+                        {"url": document["url"]},
+                        {"fingerprint": document["fingerprint"]},
+                    ]
+                },
+                {"$set": document},
+                upsert=True,
+            )
+            for document in documents
+        ]
+        try:
+            bulk_result = self._collection.bulk_write(operations, ordered=False)
+        except Exception as exc:  # noqa: BLE001
+            if BulkWriteError is None or not isinstance(exc, BulkWriteError):
                 raise WriteError(
-                    "Fingerprint existente não encontrado para atualização no MongoDB",
-                    cause=exc,
+                    "Falha ao escrever lote de artigos no MongoDB", cause=exc
                 ) from exc
+            return self._resolve_bulk_error(pairs, exc)
 
-            return ArticleWriteResult(status="updated")
+        upserted = getattr(bulk_result, "upserted_ids", None) or {}
+        return [
+            ArticleWriteResult(status="inserted", article_id=str(upserted[index]))
+            if index in upserted
+            else ArticleWriteResult(status="updated")
+            for index in range(len(pairs))
+        ]
 
-        if getattr(result, "upserted_id", None) is not None:
-            return ArticleWriteResult(status="inserted", article_id=str(result.upserted_id))
+    def flush_staging(self, pairs: Sequence[tuple[ArticleInput, str]]) -> None:
+        """Persiste um lote inteiro com uma única mesclagem no servidor.
 
-        return ArticleWriteResult(status="updated")
+        Insere os documentos em uma coleção de staging e dispara um
+        ``$merge`` casado pelo índice único de ``url``, trocando N idas ao
+        banco por uma operação em lote processada pelo próprio MongoDB. A
+        coleção de staging recebe um sufixo único por chamada, então
+        execuções concorrentes sobre o mesmo banco não pisam no lote uma
+        da outra; ela é descartada ao final, com sucesso ou não. Quando a
+        coleção não expõe banco/nome (dobles de teste), degrada para
+        ``write_many``.
 
-    def _to_document(self, article: ArticleInput, fingerprint: str) -> Mapping[str, Any]:
-        document = {
-            "url": article.url,
-            "portal_name": article.portal_name,
-            "title": article.title,
-            "summary": article.summary,
-            "content_html": article.content_html,
-            "content_text": article.content_text,
-            "tags": list(article.tags),
-            "published_at_raw": article.published_at_raw,
-            "published_at": self._to_utc(article.published_at),
-            "collected_at": self._to_utc(article.collected_at),
-            "fingerprint": fingerprint,
-            "raw_meta": dict(article.metadata),
+        ``write_many`` usa este mesmo caminho quando o writer é
+        construído com ``staging_merge=True``.
+        """
+
+        if not pairs:
+            return
+        staging = self._staging_collection()
+        if staging is None:
+            self.write_many(pairs)
+            return
+        self._merge_through_staging(staging, self._to_documents_batch(pairs))
+
+    def _merge_through_staging(
+        self, staging: Any, documents: Sequence[Mapping[str, Any]]
+    ) -> None:
+        try:
+            staging.insert_many(documents, ordered=False)
+            staging.aggregate(
+                [
+                    {
+                        "$merge": {
+                            "into": self._collection.name,
+                            "on": "url",
+                            "whenMatched": "merge",
+                            "whenNotMatched": "insert",
+                        }
+                    }
+                ]
+            )
+        except Exception as exc:  # noqa: BLE001
+            raise WriteError(
+                "Falha ao mesclar lote de artigos no MongoDB", cause=exc
+            ) from exc
+        finally:
+            self._drop_staging(staging)
+
+    def _staging_collection(self) -> Any | None:
+        database = getattr(self._collection, "database", None)
+        name = getattr(self._collection, "name", None)
+        if database is None or name is None:
+            return None
+        # Sufixo único por chamada: dois processos escrevendo no mesmo
+        # banco nunca compartilham (nem limpam) o staging um do outro.
+        return database[f"{name}_staging_{uuid4().hex}"]
+
+    @staticmethod
+    def _drop_staging(staging: Any) -> None:
+        drop = getattr(staging, "drop", None)
+        try:
+            if drop is not None:
+                drop()
+            else:
+                staging.delete_many({})
+        except Exception:  # noqa: BLE001, S110 - limpeza de melhor esforço
+            pass
+
+    def _resolve_bulk_error(
+        self, pairs: Sequence[tuple[ArticleInput, str]], exc: Exception
+    ) -> list[ArticleWriteResult]:
+        details = getattr(exc, "details", None) or {}
+        write_errors = details.get("writeErrors", [])
+        failed_indexes = {int(entry.get("index", -1)) for entry in write_errors}
+        if any(entry.get("code") != _DUPLICATE_KEY_CODE for entry in write_errors):
+            raise WriteError(
+                "Falha ao escrever lote de artigos no MongoDB", cause=exc
+            ) from exc
+
+        upserted_indexes = {
+            int(entry["index"]): entry["_id"]
+            for entry in details.get("upserted", [])
         }
-        return document
+        results: list[ArticleWriteResult] = []
+        for index, (article, fingerprint) in enumerate(pairs):
+            if index in failed_indexes:
+                results.append(self.write(article, fingerprint))
+            elif index in upserted_indexes:
+                results.append(
+                    ArticleWriteResult(
+                        status="inserted",
+                        article_id=str(upserted_indexes[index]),
+                    )
+                )
+            else:
+                results.append(ArticleWriteResult(status="updated"))
+        return results
+
+    def _to_document(self, article: ArticleInput, fingerprint: str) -> Mapping[str, Any]:
+        return self._to_documents_batch(((article, fingerprint),))[0]
+
+    def _to_documents_batch(
+        self, pairs: Sequence[tuple[ArticleInput, str]] | Iterable[tuple[ArticleInput, str]]
+    ) -> list[dict[str, Any]]:
+        """Converte um lote inteiro em documentos numa única compreensão.
+
+        O acesso a atributos dentro da compreensão evita uma chamada
+        Python por artigo; conversões de ``tags``/``metadata`` só ocorrem
+        quando o valor ainda não tem o tipo esperado.
+        """
+
+        to_utc = self._to_utc
+        documents = [
+            {
+                "url": article.url,
+                "portal_name": article.portal_name,
+                "title": article.title,
+                "summary": article.summary,
+                "content_html": article.content_html,
+                "content_text": article.content_text,
+                "tags": article.tags
+                if type(article.tags) is list
+                else list(article.tags),
+                "published_at_raw": article.published_at_raw,
+                "published_at": to_utc(article.published_at),
+                "collected_at": to_utc(article.collected_at),
+                "fingerprint": fingerprint,
+                "raw_meta": article.metadata
+                if type(article.metadata) is dict
+                else dict(article.metadata),
+            }
+            for article, fingerprint in pairs
+        ]
+        if self._fold_duplicate_content:
+            # Quando o corpo HTML é a mesma string do texto (normalizadores
+            # simples reaproveitam a referência), gravar os dois dobraria o
+            # payload BSON; persiste só o texto e marca para reidratação.
+            for document, (article, _) in zip(documents, pairs, strict=True):
+                if article.content_html is article.content_text:
+                    document["content_html"] = None
+                    document["content_is_html"] = True
+        if self._encode_raw_meta:
+            # Um único bson.encode em C por documento substitui a
+            # codificação campo a campo do dict aninhado pelo driver.
+            for document in documents:
+                document["raw_meta_bson"] = Binary(
+                    bson.encode(document.pop("raw_meta"))
+                )
+        return documents
 
     @staticmethod
     def _to_utc(value: datetime | None) -> datetime | None:
         if value is None:
             return None
-        if value.tzinfo is None:
-            return value.replace(tzinfo=timezone.utc)
-        return value.astimezone(timezone.utc)
+        tzinfo = value.tzinfo
+        if tzinfo is _UTC:
+            # Já está em UTC: devolve o mesmo objeto sem reconstruir.
+            return value
+        if tzinfo is None:
+            return value.replace(tzinfo=_UTC)
+        return value.astimezone(_UTC)
@@ -3,13 +3,48 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Iterable, Mapping, MutableSet
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, MutableSet
+from operator import attrgetter
 
 from farol_core.domain.contracts import ArticleInput, Deduper
 
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import xxhash
+except Exception:  # noqa: BLE001 - degradar para hashing da stdlib
+    xxhash = None
+
+
+_SEP = "\u241f".encode()
+
+
+def _sha256_hexdigest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _resolve_hasher(algorithm: str | None) -> Callable[[bytes], str]:
+    """Escolhe o backend de hash: SHA-256 por padrão, xxh3 sob demanda.
+
+    Fingerprints são persistidos e comparados entre execuções, então o
+    padrão precisa ser estável: trocar o algoritmo invalidaria todo o
+    histórico gravado. ``algorithm="xxh3"`` é o opt-in (uma ordem de
+    grandeza mais rápido por chamada; dedup não exige resistência
+    criptográfica) para coleções novas ou migradas; sem xxhash
+    instalado, degrada para SHA-256.
+    """
+
+    if algorithm == "xxh3" and xxhash is not None:
+        return xxhash.xxh3_128_hexdigest
+    return _sha256_hexdigest
+
 
 class Sha256Deduper(Deduper):
-    """Gera impressões digitais determinísticas usando SHA-256."""
+    """Gera impressões digitais determinísticas usando SHA-256.
+
+    O algoritmo pode ser trocado por xxh3 via ``build_deduper`` com
+    ``algorithm="xxh3"``; o padrão permanece SHA-256 para que os
+    fingerprints já persistidos continuem casando entre execuções.
+    """
 
     def __init__(
         self,
@@ -17,27 +52,156 @@ class Sha256Deduper(Deduper):
         fields: Iterable[str] | None = None,
         seen_store: MutableSet[str] | None = None,
         prefix: str = "",
+        hasher: Callable[[bytes], str] | None = None,
+        hot_cache_size: int = 0,
     ) -> None:
         self._fields = tuple(fields or ("url",))
+        self._getters = tuple(attrgetter(field) for field in self._fields)
+        self._prefix_bytes = prefix.encode("utf-8")
+        # Sem um store injetado, guarda fingerprints como ints de 64 bits
+        # (últimos 8 bytes do digest) em vez de strings hex: mesmo
+        # comportamento observável com ~1/5 da memória por entrada. O
+        # conjunto é particionado em 256 shards pelo byte baixo da chave:
+        # cada realocação de crescimento copia 1/256 do total em vez do
+        # conjunto inteiro, eliminando o pico de 2x de RSS em coletas
+        # longas.
+        self._compact_seen = seen_store is None
         self._seen = seen_store if seen_store is not None else set()
+        self._shards: tuple[set[int | str], ...] = tuple(set() for _ in range(256))
         self._prefix = prefix
+        self._hasher = hasher if hasher is not None else _resolve_hasher(None)
+        # Cache LRU opcional na frente do conjunto principal: recoletas
+        # reencontram as mesmas URLs a cada ciclo, então o working set
+        # pequeno responde sem sondar a estrutura grande e fria.
+        self._hot: OrderedDict[int | str, None] | None = (
+            OrderedDict() if hot_cache_size > 0 else None
+        )
+        self._hot_capacity = hot_cache_size
 
     def fingerprint(self, article: ArticleInput) -> str:
-        components: list[str] = [self._prefix]
-        for field in self._fields:
-            value = getattr(article, field, None)
+        return self._hasher(self._payload(article))
+
+    def fingerprint_batch(self, articles: Iterable[ArticleInput]) -> list[str]:
+        """Gera fingerprints para um lote de artigos de uma só vez.
+
+        Constrói todos os payloads antes de despachar para o backend de
+        hash, permitindo que callers troquem N chamadas por uma passada
+        única sobre o lote.
+        """
+
+        hasher = self._hasher
+        return [hasher(payload) for payload in map(self._payload, articles)]
+
+    def _payload(self, article: ArticleInput) -> bytes:
+        # Monta os bytes direto em um bytearray: evita a lista intermediária
+        # de strings, o join e o encode final sobre o payload inteiro.
+        buffer = bytearray(self._prefix_bytes)
+        serialize = self._serialize
+        for getter in self._getters:
+            try:
+                value = getter(article)
+            except AttributeError:
+                continue
             if value is None:
                 continue
-            components.append(self._serialize(value))
-        payload = "\u241f".join(components).encode("utf-8")
-        return hashlib.sha256(payload).hexdigest()
+            buffer += _SEP
+            if type(value) in (list, tuple, set):
+                buffer += serialize(value).encode("utf-8")
+            else:
+                buffer += str(value).encode("utf-8")
+        return bytes(buffer)
+
+    def pre_fingerprint(self, url: str, content_html: str) -> str:
+        """Identificador barato calculado antes da sanitização do artigo.
+
+        Permite ao caso de uso descartar conteúdo repetido sem pagar o custo
+        de ``_build_article``; o ``fingerprint`` pós-normalização continua
+        sendo o identificador autoritativo.
+        """
+
+        payload = f"{self._prefix}\u241f{url}\u241f{content_html}".encode()
+        return "pre:" + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def warm_from(self, collection: object, *, field: str = "fingerprint") -> int:
+        """Pré-carrega fingerprints já persistidos a partir de uma coleção.
+
+        Faz uma consulta só de projeção (``{field: 1, "_id": 0}``) e
+        alimenta o conjunto de vistos, evitando um upsert no-op por
+        artigo já conhecido na primeira execução do pipeline. Retorna o
+        total carregado; coleções sem ``find`` (dobles) carregam zero.
+
+        Só aquece valores produzidos pelo hasher ativo: digests de outro
+        algoritmo (ex.: SHA-256 persistido com xxh3 configurado) nunca
+        gerariam acertos, então o scan é interrompido no primeiro
+        comprimento divergente em vez de varrer a coleção em vão.
+        """
+
+        find = getattr(collection, "find", None)
+        if find is None:
+            return 0
+        cursor = find({field: {"$exists": True}}, {field: 1, "_id": 0})
+        batch_size = getattr(cursor, "batch_size", None)
+        if batch_size is not None:
+            cursor = batch_size(10_000)
+        expected_length = len(self._hasher(b""))
+        compact = self._compact_key if self._compact_seen else None
+        seen_add = self._seen.add
+        loaded = 0
+        for document in cursor:
+            value = document.get(field)
+            if not value:
+                continue
+            if len(value) != expected_length:
+                break
+            if compact is None:
+                seen_add(value)
+            else:
+                key = compact(value)
+                self._shard_for(key).add(key)
+            loaded += 1
+        return loaded
 
     def is_new(self, fingerprint: str) -> bool:
-        if fingerprint in self._seen:
+        if self._compact_seen:
+            key: int | str = self._compact_key(fingerprint)
+            store = self._shard_for(key)
+        else:
+            key = fingerprint
+            store = self._seen
+        hot = self._hot
+        if hot is not None and key in hot:
+            hot.move_to_end(key)
+            return False
+        if key in store:
+            if hot is not None:
+                self._hot_add(key)
             return False
-        self._seen.add(fingerprint)
+        store.add(key)
+        if hot is not None:
+            self._hot_add(key)
         return True
 
+    def _hot_add(self, key: int | str) -> None:
+        hot = self._hot
+        assert hot is not None
+        hot[key] = None
+        if len(hot) > self._hot_capacity:
+            hot.popitem(last=False)
+
+    def _shard_for(self, key: int | str) -> set[int | str]:
+        # Chaves compactas já são ints uniformes; strings residuais caem
+        # no hash() normal. O byte baixo espalha bem nos dois casos.
+        return self._shards[(key if type(key) is int else hash(key)) & 0xFF]
+
+    @staticmethod
+    def _compact_key(fingerprint: str) -> int | str:
+        try:
+            return int(fingerprint[-16:], 16)
+        except ValueError:
+            # Valores fora do formato hex (ex.: prefixos "pre:" curtos)
+            # seguem armazenados como string.
+            return fingerprint
+
     def _serialize(self, value: object) -> str:
         if isinstance(value, (list, tuple, set)):
             return "\u241e".join(sorted(self._serialize(item) for item in value))
@@ -50,10 +214,18 @@ def build_deduper(options: Mapping[str, object] | None = None) -> Sha256Deduper:
     options = dict(options or {})
     fields_opt = options.get("fields")
     prefix = str(options.get("prefix", ""))
+    algorithm_opt = options.get("algorithm")
+    algorithm = str(algorithm_opt) if algorithm_opt is not None else None
     if isinstance(fields_opt, Iterable) and not isinstance(fields_opt, (str, bytes)):
         fields = tuple(str(field) for field in fields_opt)
     elif isinstance(fields_opt, str):
         fields = tuple(part.strip() for part in fields_opt.split(",") if part.strip())
     else:
         fields = None
-    return Sha256Deduper(fields=fields, prefix=prefix)
+    hot_cache_size = int(options.get("hot_cache_size", 0) or 0)
+    return Sha256Deduper(
+        fields=fields,
+        prefix=prefix,
+        hasher=_resolve_hasher(algorithm),
+        hot_cache_size=hot_cache_size,
+    )
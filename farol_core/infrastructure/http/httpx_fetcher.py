@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+import asyncio
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
 from farol_core.domain.contracts import Fetcher, RawListingItem
 from farol_core.domain.errors import FetchError
 
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import httpx
+except Exception:  # noqa: BLE001 - cliente precisa ser injetado sem httpx
+    httpx = None
+
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import orjson
+except Exception:  # noqa: BLE001 - degradar para response.json()
+    orjson = None
+
+
+def _decode_payload(response: Any) -> object:
+    """Decodifica o corpo JSON direto dos bytes quando orjson existe."""
+
+    if orjson is not None:
+        content = getattr(response, "content", None)
+        if content is not None:
+            return orjson.loads(content)
+    return response.json()
+
 
 class HttpxFetcher(Fetcher):
     """Implementação de ``Fetcher`` usando um cliente httpx síncrono."""
@@ -25,38 +46,148 @@ class HttpxFetcher(Fetcher):
             raise FetchError("Falha ao buscar listagem remota", cause=exc) from exc
 
         try:
-            payload = response.json()
+            payload = _decode_payload(response)
         except Exception as exc:  # noqa: BLE001
             raise FetchError(
                 "Resposta inválida ao decodificar JSON", cause=exc
             ) from exc
 
-        items_data = self._extract_items(payload)
-        return [self._build_item(entry) for entry in items_data]
+        items_data = _extract_items(payload, self._item_key)
+        # Gerador em vez de lista: o pipeline consome uma única vez e o
+        # pico de memória deixa de crescer com o tamanho da listagem.
+        return map(_build_item, items_data)
+
+
+def _extract_items(payload: object, item_key: str) -> Iterator[Mapping[str, object]]:
+    if isinstance(payload, Mapping):
+        items = payload.get(item_key)
+    else:
+        items = payload
+
+    if not isinstance(items, list):
+        raise FetchError("Formato inesperado da listagem remota")
+
+    # Valida as chaves obrigatórias ainda dentro do fetch: a construção
+    # dos itens segue preguiçosa, mas o FetchError de campo ausente
+    # estoura na chamada, onde o contrato documenta, e não na iteração.
+    for entry in items:
+        if isinstance(entry, Mapping) and "url" not in entry:
+            raise FetchError("Item da listagem sem campo obrigatório")
+
+    return (entry for entry in items if isinstance(entry, Mapping))
+
+
+def _build_item(entry: Mapping[str, object]) -> RawListingItem:
+    try:
+        url = str(entry["url"])
+        content = str(entry.get("content", ""))
+    except KeyError as exc:
+        raise FetchError(
+            "Item da listagem sem campo obrigatório", cause=exc
+        ) from exc
+
+    if type(entry) is dict:
+        # O dict veio do decode JSON feito aqui e não é reaproveitado:
+        # remover as chaves consumidas evita copiar o restante.
+        entry.pop("url", None)
+        entry.pop("content", None)
+        metadata = entry
+    else:
+        metadata = {k: v for k, v in entry.items() if k not in {"url", "content"}}
+    return RawListingItem(url=url, content=content, metadata=metadata)
+
+
+_shared_client: Any | None = None
+
 
-    def _extract_items(self, payload: object) -> list[Mapping[str, object]]:
-        if isinstance(payload, Mapping):
-            items = payload.get(self._item_key)
-        else:
-            items = payload
+def _default_client() -> Any:
+    """Cria (uma única vez) o cliente síncrono compartilhado do processo.
 
-        if not isinstance(items, list):
-            raise FetchError("Formato inesperado da listagem remota")
+    Reaproveitar o mesmo cliente mantém o pool de conexões keep-alive
+    vivo entre fetches; construir um cliente por chamada paga handshake
+    TCP/TLS a cada listagem.
+    """
 
-        valid_items: list[Mapping[str, object]] = []
-        for entry in items:
-            if isinstance(entry, Mapping):
-                valid_items.append(entry)
-        return valid_items
+    global _shared_client
+    if _shared_client is None:
+        if httpx is None:
+            raise FetchError("httpx não está instalado; injete um cliente")
+        _shared_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        )
+    return _shared_client
+
+
+def build_httpx_fetcher(
+    url: str, *, client: Any | None = None, item_key: str = "items"
+) -> HttpxFetcher:
+    """Factory que injeta o cliente compartilhado com pool de conexões.
+
+    Todas as instâncias criadas por aqui dividem o mesmo ``httpx.Client``;
+    passe ``client`` apenas quando precisar de isolamento (ex.: testes).
+    """
+
+    return HttpxFetcher(
+        client if client is not None else _default_client(), url, item_key=item_key
+    )
+
+
+class AsyncHttpxFetcher:
+    """Busca várias listagens em paralelo com um cliente httpx assíncrono.
+
+    As requisições são disparadas com ``asyncio.gather`` sob um
+    ``Semaphore`` que limita a concorrência; os resultados preservam a
+    ordem das URLs de entrada. Sem cliente injetado, cria um
+    ``httpx.AsyncClient`` com HTTP/2 habilitado.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        *,
+        client: Any | None = None,
+        item_key: str = "items",
+        max_concurrency: int = 8,
+    ) -> None:
+        if client is None:
+            if httpx is None:
+                raise FetchError(
+                    "httpx não está instalado; injete um cliente assíncrono"
+                )
+            client = httpx.AsyncClient(http2=True)
+        self._client = client
+        self._urls = tuple(urls)
+        self._item_key = item_key
+        self._max_concurrency = max_concurrency
+
+    async def fetch_many(self) -> list[list[RawListingItem]]:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        return await asyncio.gather(
+            *(self._fetch_one(url, semaphore) for url in self._urls)
+        )
+
+    async def _fetch_one(
+        self, url: str, semaphore: asyncio.Semaphore
+    ) -> list[RawListingItem]:
+        async with semaphore:
+            try:
+                response = await self._client.get(url)
+                response.raise_for_status()
+            except Exception as exc:  # noqa: BLE001
+                raise FetchError("Falha ao buscar listagem remota", cause=exc) from exc
 
-    def _build_item(self, entry: Mapping[str, object]) -> RawListingItem:
         try:
-            url = str(entry["url"])
-            content = str(entry.get("content", ""))
-        except KeyError as exc:
+            payload = _decode_payload(response)
+        except Exception as exc:  # noqa: BLE001
             raise FetchError(
-                "Item da listagem sem campo obrigatório", cause=exc
+                "Resposta inválida ao decodificar JSON", cause=exc
             ) from exc
 
-        metadata = {k: v for k, v in entry.items() if k not in {"url", "content"}}
-        return RawListingItem(url=url, content=content, metadata=metadata)
+        items_data = _extract_items(payload, self._item_key)
+        return [_build_item(entry) for entry in items_data]
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._client, "aclose", None)
+        if aclose is not None:
+            await aclose()
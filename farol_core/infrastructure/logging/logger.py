@@ -4,18 +4,44 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import socket
 from logging import Logger, LogRecord
+from typing import Any
+
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import orjson
+except Exception:  # noqa: BLE001 - degradar para json da stdlib
+    orjson = None
+
+# Campos estáticos do processo: resolvidos uma vez na importação em vez de
+# uma chamada de sistema por registro emitido.
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+_EMPTY_EXTRA = "{}"
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False)
 
 
 class StructuredFormatter(logging.Formatter):
     """Formatter que serializa o atributo ``extra`` caso exista."""
 
     def format(self, record: LogRecord) -> str:  # noqa: D401
-        extra_value = getattr(record, "extra", {})
-        if not isinstance(extra_value, dict):
-            extra_value = {"value": extra_value}
-        formatted_extra = json.dumps(extra_value, ensure_ascii=False)
-        record.__dict__["extra"] = formatted_extra
+        record.__dict__.setdefault("hostname", _HOSTNAME)
+        record.__dict__.setdefault("pid", _PID)
+        extra_value = getattr(record, "extra", None)
+        if not extra_value:
+            # Maioria dos registros não carrega extra; evita serializar
+            # um dicionário vazio a cada linha.
+            record.__dict__["extra"] = _EMPTY_EXTRA
+        else:
+            if not isinstance(extra_value, dict):
+                extra_value = {"value": extra_value}
+            record.__dict__["extra"] = _dumps(extra_value)
         return super().format(record)
 
 
@@ -30,7 +56,8 @@ def configure_logger(name: str = "farol") -> Logger:
 
     handler = logging.StreamHandler()
     formatter = StructuredFormatter(
-        fmt="%(asctime)s %(name)s %(levelname)s %(message)s | extra=%(extra)s",
+        fmt="%(asctime)s %(hostname)s[%(pid)d] %(name)s %(levelname)s "
+        "%(message)s | extra=%(extra)s",
         datefmt="%Y-%m-%dT%H:%M:%S",
     )
     handler.setFormatter(formatter)
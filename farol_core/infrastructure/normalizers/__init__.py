@@ -1,14 +1,17 @@
 """Implementações de normalizadores HTML e utilidades de texto."""
 
 from .date_normalizer import FlexibleDateNormalizer, build_date_normalizer
+from .lexbor_text_cleaner import LexborTextCleaner, build_lexbor_text_cleaner
 from .text_cleaner import SoupTextCleaner, build_text_cleaner
 from .url_normalizer import SimpleUrlNormalizer, build_url_normalizer
 
 __all__ = [
     "FlexibleDateNormalizer",
+    "LexborTextCleaner",
     "SoupTextCleaner",
     "SimpleUrlNormalizer",
     "build_date_normalizer",
+    "build_lexbor_text_cleaner",
     "build_text_cleaner",
     "build_url_normalizer",
 ]
@@ -4,9 +4,20 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from farol_core.domain.contracts import DateNormalizer
 
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import ciso8601
+except Exception:  # noqa: BLE001 - degradar para fromisoformat
+    ciso8601 = None
+
+_RELATIVE_TODAY = frozenset({"hoje", "today"})
+_RELATIVE_YESTERDAY = frozenset({"ontem", "yesterday"})
+
+# Fallback lento para layouts que os caminhos rápidos rejeitam (ex.:
+# dias/meses sem zero à esquerda, que strptime aceita e o fatiamento não).
 _SUPPORTED_FORMATS: tuple[str, ...] = (
     "%Y-%m-%d",
     "%Y-%m-%d %H:%M",
@@ -17,6 +28,74 @@ _SUPPORTED_FORMATS: tuple[str, ...] = (
 )
 
 
+def _parse_with_formats(text: str) -> datetime | None:
+    for pattern in _SUPPORTED_FORMATS:
+        try:
+            return datetime.strptime(text, pattern)
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_br_date(text: str) -> datetime | None:
+    """Interpreta ``dd/mm/aaaa`` com hora opcional sem passar por strptime.
+
+    ``strptime`` reconstrói a máquina de estados do formato a cada chamada;
+    o layout brasileiro é fixo o suficiente para fatiar direto.
+    """
+
+    if len(text) < 10 or text[2] != "/" or text[5] != "/":
+        # Fora do layout zero-padded: deixa para o fallback strptime.
+        return None
+    try:
+        day, month, year = int(text[:2]), int(text[3:5]), int(text[6:10])
+        clock = text[10:]
+        if not clock:
+            return datetime(year, month, day)
+        if clock[0] != " ":
+            return None
+        parts = clock[1:].split(":")
+        if len(parts) == 2:
+            return datetime(year, month, day, int(parts[0]), int(parts[1]))
+        if len(parts) == 3:
+            return datetime(
+                year, month, day, int(parts[0]), int(parts[1]), int(parts[2])
+            )
+    except ValueError:
+        return None
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_absolute(text: str) -> datetime | None:
+    """Resolve (e memoiza) datas absolutas repetidas no mesmo feed.
+
+    Listagens repetem o mesmo punhado de strings de data; como
+    ``datetime`` é imutável, o resultado pode ser cacheado com
+    segurança. ``_parse_absolute.cache_info()`` expõe a taxa de acerto.
+    """
+
+    if ciso8601 is not None:
+        # Backend C dedicado: mais rápido que fromisoformat e tolerante a
+        # variações ISO 8601 que o parser da stdlib rejeita.
+        try:
+            return ciso8601.parse_datetime(text)
+        except ValueError:
+            pass
+    else:
+        try:
+            # CPython 3.11+ cobre os layouts ISO (com espaço ou "T") em C.
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+    parsed = _parse_br_date(text)
+    if parsed is not None:
+        return parsed
+    # Último recurso: o laço strptime original, que ainda aceita
+    # variantes sem zero à esquerda ("1/1/2024", "2024-1-1").
+    return _parse_with_formats(text)
+
+
 class FlexibleDateNormalizer(DateNormalizer):
     """Interpreta formatos comuns e expressões relativas simples."""
 
@@ -29,22 +108,15 @@ class FlexibleDateNormalizer(DateNormalizer):
             return None
 
         text = text.replace("Z", "+00:00")
-        try:
-            return datetime.fromisoformat(text)
-        except ValueError:
-            pass
-
-        for pattern in _SUPPORTED_FORMATS:
-            try:
-                return datetime.strptime(text, pattern)
-            except ValueError:
-                continue
+        parsed = _parse_absolute(text)
+        if parsed is not None:
+            return parsed
 
         lower = text.lower()
         if reference and self._fallback_to_reference:
-            if lower in {"hoje", "today"}:
+            if lower in _RELATIVE_TODAY:
                 return reference.replace(hour=0, minute=0, second=0, microsecond=0)
-            if lower in {"ontem", "yesterday"}:
+            if lower in _RELATIVE_YESTERDAY:
                 day = reference - timedelta(days=1)
                 return day.replace(hour=0, minute=0, second=0, microsecond=0)
 
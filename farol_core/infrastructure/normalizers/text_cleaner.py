@@ -8,22 +8,33 @@ from collections.abc import Iterable, Mapping
 from farol_core.domain.contracts import TextCleaner
 from farol_core.infrastructure.parsing.html_tree import HTMLDocument
 
-_RE_WHITESPACE = re.compile(r"\s+")
+# Um único padrão cobre os dois passes antigos: espaço antes de pontuação
+# colapsa para a própria pontuação, qualquer outra sequência vira " ".
+_RE_CLEAN = re.compile(r"\s+([!?.,;:])|\s+")
+
+
+def _collapse_whitespace(match: re.Match[str]) -> str:
+    return match.group(1) or " "
+
+
+_SAFE_ATTRS = frozenset({"href", "title"})
 
 
 class SoupTextCleaner(TextCleaner):
     """Limpa HTML utilizando um parser leve baseado em ``html.parser``."""
 
     def __init__(self, *, allowed_tags: Iterable[str] | None = None) -> None:
-        self._allowed_tags = tuple(allowed_tags or ("p", "br", "strong", "em", "ul", "ol", "li", "a", "blockquote"))
+        self._allowed_tags = frozenset(
+            allowed_tags
+            or ("p", "br", "strong", "em", "ul", "ol", "li", "a", "blockquote")
+        )
 
     def clean_html_to_text(self, html: str) -> str:
         soup = HTMLDocument.from_html(html or "")
         for tag in soup(["script", "style"]):
             tag.decompose()
         text = soup.root.get_text(" ", strip=True)
-        text = _RE_WHITESPACE.sub(" ", text).strip()
-        return re.sub(r"\s+([!?.,;:])", r"\1", text)
+        return _RE_CLEAN.sub(_collapse_whitespace, text).strip()
 
     def sanitize_html(self, html: str) -> str:
         soup = HTMLDocument.from_html(html or "")
@@ -36,9 +47,9 @@ class SoupTextCleaner(TextCleaner):
                 if href and href.lower().startswith("javascript:"):
                     del tag["href"]
             # remove atributos potencialmente perigosos
-            for attribute in list(tag.attrs):
-                if attribute not in {"href", "title"}:
-                    del tag[attribute]
+            tag.attrs = {
+                key: value for key, value in tag.attrs.items() if key in _SAFE_ATTRS
+            }
         for dangerous in soup(["script", "style"]):
             dangerous.decompose()
         sanitized = str(soup)
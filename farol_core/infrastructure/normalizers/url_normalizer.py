@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Mapping
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
 from farol_core.domain.contracts import UrlNormalizer
 
+# Guarda barata: só URLs absolutas com host em maiúsculas ou porta padrão
+# explícita precisam do passe de canonicalização (urlsplit + reescrita).
+_CANON_NEEDED_RE = re.compile(r"^https?://[^/?#]*(?:[A-Z]|:(?:80|443)(?=[/?#]|$))")
+_HTTP_PORT_RE = re.compile(r":80$")
+_HTTPS_PORT_RE = re.compile(r":443$")
+
 
 class SimpleUrlNormalizer(UrlNormalizer):
     """Normaliza URLs relativas usando ``urllib.parse.urljoin``."""
@@ -19,13 +26,42 @@ class SimpleUrlNormalizer(UrlNormalizer):
         if not candidate:
             raise ValueError("URL não pode ser vazia para normalização")
 
+        # Fast-path: hrefs absolutos (o caso dominante em listagens) saem
+        # intactos de urljoin, então evita o parse da base por item. Todo
+        # resultado absoluto — direto ou resolvido via urljoin — passa
+        # pela mesma guarda de canonicalização, para que a mesma URL
+        # lógica nunca produza duas formas normalizadas distintas.
+        if candidate.startswith(("http://", "https://")):
+            return self._finalize(candidate)
+
         base_candidate = (base_url or "").strip()
         if base_candidate:
-            return urljoin(base_candidate, candidate)
+            return self._finalize(urljoin(base_candidate, candidate))
         if self._default_base:
-            return urljoin(self._default_base, candidate)
+            return self._finalize(urljoin(self._default_base, candidate))
         return candidate
 
+    @classmethod
+    def _finalize(cls, url: str) -> str:
+        if _CANON_NEEDED_RE.match(url):
+            return cls._canonicalize(url)
+        return url
+
+    @staticmethod
+    def _canonicalize(url: str) -> str:
+        """Rebaixa o host e remove a porta padrão em um único passe.
+
+        Um ``urlsplit`` + duas substituições compiladas substituem os
+        laços caractere a caractere; caminho, query e fragmento ficam
+        intactos.
+        """
+
+        scheme, netloc, path, query, fragment = urlsplit(url)
+        netloc = netloc.lower()
+        port_re = _HTTP_PORT_RE if scheme == "http" else _HTTPS_PORT_RE
+        netloc = port_re.sub("", netloc)
+        return urlunsplit((scheme, netloc, path, query, fragment))
+
     def _normalize_default_base(self, value: str | None) -> str | None:
         if not value:
             return None
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from html import escape
 from html.parser import HTMLParser
 from typing import Any, Iterable, Iterator
 
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    from lxml import html as _lxml_html
+except Exception:  # noqa: BLE001 - degradar para o parser puro-Python
+    _lxml_html = None
+
 
 @dataclass
 class HTMLNode:
@@ -41,40 +47,56 @@ class HTMLNode:
         return list(self._find_all(tags))
 
     def _find_all(self, tags: Iterable[str] | bool) -> Iterator[HTMLNode]:
-        tags_set: set[str] | None
-        if tags is True:
-            tags_set = None
-        elif tags is False:
+        if tags is False:
             return iter(())
-        elif isinstance(tags, str):
-            tags_set = {tags.lower()}
+        if tags is True:
+            return self.iter_descendants(include_self=False)
+        if isinstance(tags, str):
+            tags_set = frozenset((tags.lower(),))
         else:
-            tags_set = {str(tag).lower() for tag in tags}
-
-        for node in self.iter_descendants(include_self=False):
-            if tags_set is None or node.tag.lower() in tags_set:
-                yield node
+            tags_set = frozenset(str(tag).lower() for tag in tags)
+        return (
+            node
+            for node in self.iter_descendants(include_self=False)
+            if node.tag.lower() in tags_set
+        )
 
     def iter_descendants(self, *, include_self: bool = True) -> Iterator[HTMLNode]:
+        # DFS com pilha explícita: sem custo de chamada por nó e sem risco
+        # de estourar o limite de recursão em HTML profundo.
         if include_self and self.tag != "__root__":
             yield self
-        for child in self.children:
-            if isinstance(child, HTMLNode):
-                yield from child.iter_descendants(include_self=True)
+        stack = [child for child in reversed(self.children) if isinstance(child, HTMLNode)]
+        while stack:
+            node = stack.pop()
+            yield node
+            for child in reversed(node.children):
+                if isinstance(child, HTMLNode):
+                    stack.append(child)
 
     def select(self, selector: str) -> list[HTMLNode]:
-        parts = [_parse_selector(part) for part in selector.split() if part.strip()]
+        return self.select_compiled(compile_selector(selector))
+
+    def select_compiled(self, parts: tuple[_Selector, ...]) -> list[HTMLNode]:
         if not parts:
             return []
-        matches: list[HTMLNode] = []
-        for node in self.iter_descendants(include_self=False):
-            if _matches_selector(node, parts):
-                matches.append(node)
-        return matches
+        return [
+            node
+            for node in self.iter_descendants(include_self=False)
+            if _matches_selector(node, parts)
+        ]
 
     def select_one(self, selector: str) -> HTMLNode | None:
-        results = self.select(selector)
-        return results[0] if results else None
+        return self.select_one_compiled(compile_selector(selector))
+
+    def select_one_compiled(self, parts: tuple[_Selector, ...]) -> HTMLNode | None:
+        # Sai no primeiro casamento em vez de materializar todos.
+        if not parts:
+            return None
+        for node in self.iter_descendants(include_self=False):
+            if _matches_selector(node, parts):
+                return node
+        return None
 
     def get_text(self, separator: str = "", strip: bool = False) -> str:
         parts: list[str] = []
@@ -85,15 +107,22 @@ class HTMLNode:
     def unwrap(self) -> None:
         if not self.parent:
             return
-        index = self.parent.children.index(self)
-        self.parent.children.pop(index)
-        for child in reversed(self.children):
-            self.parent.children.insert(index, child)
+        siblings = self.parent.children
+        # Localiza por identidade (o __eq__ do dataclass casaria irmãos
+        # iguais) e emenda os filhos com uma única atribuição de fatia.
+        for index, sibling in enumerate(siblings):
+            if sibling is self:
+                siblings[index : index + 1] = self.children
+                return
 
     def decompose(self) -> None:
         if not self.parent:
             return
-        self.parent.children = [child for child in self.parent.children if child is not self]
+        siblings = self.parent.children
+        for index, sibling in enumerate(siblings):
+            if sibling is self:
+                del siblings[index]
+                return
 
     def __str__(self) -> str:
         return _node_to_html(self)
@@ -133,7 +162,16 @@ class HTMLDocument:
     root: HTMLNode
 
     @classmethod
-    def from_html(cls, html: str) -> HTMLDocument:
+    def from_html(cls, html: str | bytes) -> HTMLDocument:
+        if _lxml_html is not None and html:
+            try:
+                # libxml2 aceita bytes e resolve o charset pelo próprio
+                # documento, evitando um decode Python redundante.
+                return cls(_root_from_lxml(html))
+            except Exception:  # noqa: BLE001 - markup que o libxml2 rejeita
+                pass
+        if isinstance(html, bytes):
+            html = html.decode("utf-8", errors="replace")
         parser = _TreeBuilder()
         parser.feed(html or "")
         parser.close()
@@ -145,9 +183,15 @@ class HTMLDocument:
     def select(self, selector: str) -> list[HTMLNode]:
         return self.root.select(selector)
 
+    def select_compiled(self, parts: tuple[_Selector, ...]) -> list[HTMLNode]:
+        return self.root.select_compiled(parts)
+
     def select_one(self, selector: str) -> HTMLNode | None:
         return self.root.select_one(selector)
 
+    def select_one_compiled(self, parts: tuple[_Selector, ...]) -> HTMLNode | None:
+        return self.root.select_one_compiled(parts)
+
     def __call__(self, tags: Iterable[str] | bool = True) -> list[HTMLNode]:
         return self.find_all(tags)
 
@@ -155,41 +199,101 @@ class HTMLDocument:
         return _node_children_to_html(self.root)
 
 
+def _root_from_lxml(html: str | bytes) -> HTMLNode:
+    """Monta a árvore de ``HTMLNode`` a partir do parser C do libxml2.
+
+    ``fragments_fromstring`` preserva os nós de topo sem envolvê-los em
+    ``<html>``, espelhando o comportamento do ``_TreeBuilder``.
+    """
+
+    root = HTMLNode("__root__")
+    for fragment in _lxml_html.fragments_fromstring(html):
+        if isinstance(fragment, str):
+            root.append_child(fragment)
+        else:
+            root.append_child(_node_from_lxml(fragment))
+    return root
+
+
+def _node_from_lxml(element: Any) -> HTMLNode:
+    node = HTMLNode(
+        str(element.tag), {str(key): value or "" for key, value in element.attrib.items()}
+    )
+    if element.text:
+        node.append_child(element.text)
+    for child in element:
+        if isinstance(child.tag, str):
+            node.append_child(_node_from_lxml(child))
+        if child.tail:
+            node.append_child(child.tail)
+    return node
+
+
 def _collect_text(node: HTMLNode, parts: list[str]) -> None:
-    for child in node.children:
+    stack: list[HTMLNode | str] = list(reversed(node.children))
+    while stack:
+        child = stack.pop()
         if isinstance(child, str):
             parts.append(child)
         else:
-            _collect_text(child, parts)
+            stack.extend(reversed(child.children))
 
 
 def _node_to_html(node: HTMLNode) -> str:
-    attrs = "".join(
-        f' {key}="{escape(value, quote=True)}"'
-        for key, value in node.attrs.items()
-        if value is not None
-    )
-    inner = _node_children_to_html(node)
-    return f"<{node.tag}{attrs}>{inner}</{node.tag}>"
+    parts: list[str] = []
+    _write_node(node, parts)
+    return "".join(parts)
 
 
 def _node_children_to_html(node: HTMLNode) -> str:
     parts: list[str] = []
     for child in node.children:
         if isinstance(child, HTMLNode):
-            parts.append(_node_to_html(child))
+            _write_node(child, parts)
         else:
             parts.append(child)
     return "".join(parts)
 
 
+def _write_node(node: HTMLNode, parts: list[str]) -> None:
+    """Serializa a subárvore em uma única passada, sem strings intermediárias.
+
+    A versão recursiva materializava o HTML completo de cada subárvore a
+    cada nível; aqui os tokens vão direto para ``parts`` e há um único
+    ``join`` no final.
+    """
+
+    stack: list[HTMLNode | str] = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            parts.append(current)
+            continue
+        attrs = "".join(
+            f' {key}="{escape(value, quote=True)}"'
+            for key, value in current.attrs.items()
+            if value is not None
+        )
+        parts.append(f"<{current.tag}{attrs}>")
+        stack.append(f"</{current.tag}>")
+        for child in reversed(current.children):
+            stack.append(child)
+
+
 @dataclass
 class _Selector:
     tag: str | None
-    classes: tuple[str, ...]
+    classes: frozenset[str]
     element_id: str | None
 
 
+@lru_cache(maxsize=512)
+def compile_selector(selector: str) -> tuple[_Selector, ...]:
+    """Compila (e memoiza) a cadeia de seletores simples de um seletor CSS."""
+
+    return tuple(_parse_selector(part) for part in selector.split() if part.strip())
+
+
 def _parse_selector(selector: str) -> _Selector:
     selector = selector.strip()
     tag: str | None = None
@@ -220,10 +324,14 @@ def _parse_selector(selector: str) -> _Selector:
                 tag = token
     if tag == "":
         tag = None
-    return _Selector(tag=tag, classes=tuple(classes), element_id=element_id)
+    return _Selector(
+        tag=tag.lower() if tag else None,
+        classes=frozenset(classes),
+        element_id=element_id,
+    )
 
 
-def _matches_selector(node: HTMLNode, selectors: list[_Selector]) -> bool:
+def _matches_selector(node: HTMLNode, selectors: tuple[_Selector, ...]) -> bool:
     current: HTMLNode | None = node
     for index, selector in enumerate(reversed(selectors)):
         if current is None or current.tag == "__root__":
@@ -245,18 +353,24 @@ def _matches_selector(node: HTMLNode, selectors: list[_Selector]) -> bool:
     return True
 
 
+def match_selector(node: HTMLNode, parts: tuple[_Selector, ...]) -> bool:
+    """Avalia um seletor já compilado contra um nó específico."""
+
+    return bool(parts) and _matches_selector(node, parts)
+
+
 def _matches_simple(node: HTMLNode, selector: _Selector) -> bool:
-    if selector.tag and node.tag.lower() != selector.tag.lower():
+    if selector.tag and node.tag.lower() != selector.tag:
         return False
     if selector.element_id:
         node_id = node.attrs.get("id")
         if node_id != selector.element_id:
             return False
-    if selector.classes:
-        node_classes = set(node.attrs.get("class", "").split())
-        if not all(cls in node_classes for cls in selector.classes):
-            return False
+    if selector.classes and not selector.classes.issubset(
+        node.attrs.get("class", "").split()
+    ):
+        return False
     return True
 
 
-__all__ = ["HTMLDocument", "HTMLNode"]
+__all__ = ["HTMLDocument", "HTMLNode", "compile_selector", "match_selector"]
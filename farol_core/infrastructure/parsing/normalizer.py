@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import ChainMap
 from collections.abc import Iterable, Sequence
 from datetime import datetime
 
@@ -22,6 +23,20 @@ class SimpleNormalizer(Normalizer):
         self._fallback_title = fallback_title
 
     def normalize(self, article: RawArticle) -> ArticleInput:
+        return self._normalize_with_now(article, datetime.utcnow())
+
+    def normalize_many(self, articles: Iterable[RawArticle]) -> list[ArticleInput]:
+        """Normaliza um lote compartilhando um único instante de coleta.
+
+        Na granularidade de um lote o timestamp é indistinguível entre os
+        artigos, então capturar ``now`` uma vez elimina N chamadas a
+        ``datetime.utcnow`` (e N serializações ISO) no caminho quente.
+        """
+
+        now = datetime.utcnow()
+        return [self._normalize_with_now(article, now) for article in articles]
+
+    def _normalize_with_now(self, article: RawArticle, now: datetime) -> ArticleInput:
         if not article.body:
             raise NormalizeError("Artigo sem conteúdo para normalização")
 
@@ -37,9 +52,14 @@ class SimpleNormalizer(Normalizer):
 
         tags: Sequence[str] = self._extract_tags(article)
 
-        metadata = dict(article.metadata)
-        now = datetime.utcnow()
-        metadata.setdefault("normalized_at", now.isoformat())
+        # Overlay sobre os metadados originais em vez de copiá-los: só o
+        # delta (normalized_at) é alocado por artigo; quem precisa de um
+        # dict plano materializa com dict(metadata) na própria fronteira
+        # de escrita.
+        overlay: dict[str, object] = {}
+        if "normalized_at" not in article.metadata:
+            overlay["normalized_at"] = now.isoformat()
+        metadata = ChainMap(overlay, article.metadata)
 
         portal_name = str(metadata.get("portal_name", ""))
         published_at_raw = metadata.get("published_at_raw")
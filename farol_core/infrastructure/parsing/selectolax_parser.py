@@ -27,21 +27,21 @@ class SelectolaxParser(Parser):
     ) -> None:
         if HTMLParser is None:
             raise ImportError("selectolax não está disponível")
-        assert HTMLParser is not None
         self._parser_cls: type[Any] = HTMLParser
         self._selectors = dict(selectors)
+        self._selector_items = tuple(self._selectors.items())
         self._required = required_fields or frozenset({"title", "body"})
 
     def parse(self, item: RawListingItem) -> RawArticle:
         try:
-            parser = self._parser_cls(item.content)
+            parser = self._parser_cls(item.content or "")
         except Exception as exc:  # noqa: BLE001
             raise ParseError(
                 "Não foi possível inicializar o parser HTML", cause=exc
             ) from exc
 
         extracted: dict[str, str | None] = {}
-        for field, selector in self._selectors.items():
+        for field, selector in self._selector_items:
             node = parser.css_first(selector)
             extracted[field] = node.text(separator=" ").strip() if node else None
 
@@ -1,5 +1,6 @@
 """Componentes para scrapers baseados em requests e parsing HTML leve."""
 
+from .lexbor_parsers import LexborArticleParser, LexborListingParser
 from .requests_soup_scraper import (
     PaginatedHttpFetcher,
     RequestsSoupScraper,
@@ -8,6 +9,8 @@ from .requests_soup_scraper import (
 )
 
 __all__ = [
+    "LexborArticleParser",
+    "LexborListingParser",
     "PaginatedHttpFetcher",
     "RequestsSoupScraper",
     "SoupArticleParser",
@@ -0,0 +1,209 @@
+"""Parsers de listagem/artigo sobre o backend Lexbor do selectolax."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple, cast
+
+from farol_core.domain.contracts import Parser, RawArticle, RawListingItem
+from farol_core.domain.errors import ParseError
+
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    from selectolax.lexbor import LexborHTMLParser as _LexborHTMLParser
+except Exception:  # noqa: BLE001 - degradar para import tardio
+    _LexborHTMLParser = None
+
+LexborHTMLParser = cast(type[Any] | None, _LexborHTMLParser)
+
+
+class _MetaSpec(NamedTuple):
+    """Opção de metadado pré-digerida: sem dict lookups no loop quente."""
+
+    key: str
+    selector: str
+    attr: str | None
+    collect_all: bool
+    want_html: bool
+
+
+def _normalize_selectors(
+    metadata_selectors: Mapping[str, Mapping[str, object] | str] | None,
+) -> dict[str, Mapping[str, object]]:
+    return {
+        key: (value if isinstance(value, Mapping) else {"selector": value})
+        for key, value in (metadata_selectors or {}).items()
+    }
+
+
+def _build_meta_specs(
+    metadata_selectors: Mapping[str, Mapping[str, object]],
+) -> tuple[_MetaSpec, ...]:
+    specs: list[_MetaSpec] = []
+    for key, options in metadata_selectors.items():
+        selector = str(options.get("selector", "")).strip()
+        if not selector:
+            continue
+        attr = options.get("attr")
+        want_html = attr == "html"
+        attr_name = attr if isinstance(attr, str) and attr and not want_html else None
+        specs.append(
+            _MetaSpec(
+                key=key,
+                selector=selector,
+                attr=attr_name,
+                collect_all=bool(options.get("all")),
+                want_html=want_html,
+            )
+        )
+    return tuple(specs)
+
+
+def _extract_metadata(element: Any, spec: _MetaSpec) -> object | None:
+    if spec.collect_all:
+        nodes = element.css(spec.selector)
+    else:
+        node = element.css_first(spec.selector)
+        nodes = [node] if node else []
+    if not nodes:
+        return None
+    values: list[object] = []
+    for node in nodes:
+        if spec.want_html:
+            values.append(node.html)
+        elif spec.attr is not None:
+            values.append(node.attributes.get(spec.attr))
+        else:
+            values.append(node.text(separator=" ").strip())
+    if spec.collect_all:
+        return tuple(value for value in values if value is not None)
+    return next((value for value in values if value is not None), None)
+
+
+class LexborListingParser:
+    """Equivalente de ``SoupListingParser`` sobre o parser HTML5 em C.
+
+    A API é idêntica à versão pura-Python; a diferença é que a árvore
+    inteira vive no Lexbor e apenas os valores extraídos atravessam para
+    o lado Python, cortando alocações por item.
+    """
+
+    def __init__(
+        self,
+        *,
+        item_selector: str,
+        link_selector: str = "a",
+        url_attribute: str = "href",
+        title_selector: str | None = None,
+        summary_selector: str | None = None,
+        metadata_selectors: Mapping[str, Mapping[str, object] | str] | None = None,
+        include_content: bool = False,
+    ) -> None:
+        if LexborHTMLParser is None:
+            raise ImportError("selectolax não está disponível")
+        self._item_selector = item_selector
+        # ``element.html`` devolve o HTML serializado em C: barato o
+        # suficiente para alimentar o parse inline quando habilitado.
+        self._include_content = include_content
+        # Normalizados na construção: seletores vazios viram None/"" e o
+        # loop por item não dispara consultas CSS mortas.
+        self._link_selector = (link_selector or "").strip()
+        self._url_attribute = url_attribute
+        self._title_selector = (title_selector or "").strip() or None
+        self._summary_selector = (summary_selector or "").strip() or None
+        self._metadata_selectors = _normalize_selectors(metadata_selectors)
+        self._meta_specs = _build_meta_specs(self._metadata_selectors)
+
+    def extract(
+        self,
+        html: str,
+        *,
+        base_url: str,
+        page_metadata: Mapping[str, object] | None = None,
+    ) -> Iterable[RawListingItem]:
+        assert LexborHTMLParser is not None
+        tree = LexborHTMLParser(html or "")
+        for element in tree.css(self._item_selector):
+            link_element = (
+                element.css_first(self._link_selector)
+                if self._link_selector
+                else element
+            )
+            href = ""
+            if link_element is not None:
+                href = (link_element.attributes.get(self._url_attribute) or "").strip()
+            if not href:
+                continue
+            metadata = dict(page_metadata or {})
+            if link_element is not None:
+                link_text = link_element.text(separator=" ").strip()
+                if link_text and "title" not in metadata:
+                    metadata["title"] = link_text
+            if self._title_selector:
+                title_node = element.css_first(self._title_selector)
+                if title_node and (title_text := title_node.text(separator=" ").strip()):
+                    metadata.setdefault("title", title_text)
+            if self._summary_selector:
+                summary_node = element.css_first(self._summary_selector)
+                if summary_node:
+                    metadata.setdefault("summary_html", summary_node.html)
+                    metadata.setdefault(
+                        "summary_text", summary_node.text(separator=" ").strip()
+                    )
+            for spec in self._meta_specs:
+                value = _extract_metadata(element, spec)
+                if value is not None:
+                    metadata[spec.key] = value
+            yield RawListingItem(
+                url=href,
+                content=element.html if self._include_content else None,
+                metadata=metadata,
+            )
+
+
+class LexborArticleParser(Parser):
+    """Equivalente de ``SoupArticleParser`` sobre o backend Lexbor."""
+
+    def __init__(
+        self,
+        *,
+        body_selector: str,
+        title_selector: str | None = None,
+        metadata_selectors: Mapping[str, Mapping[str, object] | str] | None = None,
+    ) -> None:
+        if LexborHTMLParser is None:
+            raise ImportError("selectolax não está disponível")
+        self._body_selector = body_selector
+        self._title_selector = (title_selector or "").strip() or None
+        self._metadata_selectors = _normalize_selectors(metadata_selectors)
+        self._meta_specs = _build_meta_specs(self._metadata_selectors)
+
+    def parse(self, item: RawListingItem) -> RawArticle:
+        assert LexborHTMLParser is not None
+        tree = LexborHTMLParser(item.content or "")
+        body_node = tree.css_first(self._body_selector)
+        if not body_node:
+            raise ParseError("Não foi possível localizar o corpo do artigo")
+
+        metadata = dict(item.metadata)
+        if self._title_selector:
+            title_node = tree.css_first(self._title_selector)
+            if title_node and (title_text := title_node.text(separator=" ").strip()):
+                metadata.setdefault("title", title_text)
+        for spec in self._meta_specs:
+            value = _extract_metadata(tree, spec)
+            if value is not None:
+                metadata[spec.key] = value
+
+        title_value = metadata.get("title")
+        if title_value is not None:
+            title_value = str(title_value)
+
+        return RawArticle(
+            url=item.url,
+            title=title_value,
+            body=body_node.html or "",
+            metadata=metadata,
+        )
+
+
+__all__ = ["LexborArticleParser", "LexborListingParser"]
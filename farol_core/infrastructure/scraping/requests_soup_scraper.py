@@ -2,24 +2,133 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+import re
+from collections import ChainMap, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType, ModuleType, TracebackType
+from typing import Any, NamedTuple
 
 from farol_core.application.collect_usecase import RequestsSoupScraper as ScraperProtocol
 from farol_core.application.collect_usecase import ScrapedItem
 from farol_core.domain.contracts import Parser, RawArticle, RawListingItem, UrlNormalizer
 from farol_core.domain.errors import FetchError, ParseError
-from farol_core.infrastructure.parsing.html_tree import HTMLDocument, HTMLNode
+from farol_core.infrastructure.parsing.html_tree import (
+    HTMLDocument,
+    HTMLNode,
+    compile_selector,
+    match_selector,
+)
+
+
+_TAG_SPLIT = re.compile(r"[,\s]*,[,\s]*")
+
+
+def _response_payload(response: Any) -> str | bytes:
+    """Prefere os bytes crus da resposta, pulando o decode de ``.text``.
+
+    O parser HTML aceita bytes (e o backend lxml resolve o charset pelo
+    próprio documento); respostas sem ``content`` (dobles) caem em
+    ``.text``.
+    """
+
+    payload = getattr(response, "content", None)
+    if payload is not None:
+        return payload
+    return getattr(response, "text", "")
+
+
+class _MetaSpec(NamedTuple):
+    """Forma pré-digerida de uma opção de metadado: zero dict lookups no loop."""
+
+    key: str
+    compiled: tuple[Any, ...]
+    attr: str | None
+    collect_all: bool
+    want_html: bool
+
+
+def _build_meta_specs(
+    metadata_selectors: Mapping[str, Mapping[str, object]],
+) -> tuple[_MetaSpec, ...]:
+    specs: list[_MetaSpec] = []
+    for key, options in metadata_selectors.items():
+        selector = str(options.get("selector", "")).strip()
+        if not selector:
+            continue
+        attr = options.get("attr")
+        want_html = attr == "html"
+        attr_name = attr if isinstance(attr, str) and attr and not want_html else None
+        specs.append(
+            _MetaSpec(
+                key=key,
+                compiled=compile_selector(selector),
+                attr=attr_name,
+                collect_all=bool(options.get("all")),
+                want_html=want_html,
+            )
+        )
+    return tuple(specs)
+
+
+def _metadata_from_nodes(nodes: list[Any], spec: _MetaSpec) -> object | None:
+    if not nodes:
+        return None
+    values: list[object] = []
+    for node in nodes:
+        if spec.want_html:
+            values.append(str(node))
+        elif spec.attr is not None:
+            values.append(node.get(spec.attr))
+        else:
+            values.append(node.get_text(" ", strip=True))
+    if spec.collect_all:
+        return tuple(value for value in values if value is not None)
+    return next((value for value in values if value is not None), None)
+
+
+def _extract_metadata_spec(element: Any, spec: _MetaSpec) -> object | None:
+    if spec.collect_all:
+        nodes = element.select_compiled(spec.compiled)
+    else:
+        node = element.select_one_compiled(spec.compiled)
+        nodes = [node] if node else []
+    return _metadata_from_nodes(nodes, spec)
 
 
 @dataclass(slots=True)
 class _FetchedPage:
-    html: str
+    html: str | bytes
     url: str
     metadata: Mapping[str, object]
 
 
+_worker_parser: Parser | None = None
+
+
+def _init_parse_worker(parser: Parser) -> None:
+    """Inicializa cada worker do pool de parse com o parser já construído.
+
+    O parser atravessa o pickle uma única vez por worker (via
+    ``initializer``) em vez de uma vez por tarefa.
+    """
+
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parse_in_worker(content_item: RawListingItem) -> RawArticle:
+    assert _worker_parser is not None
+    return _worker_parser.parse(content_item)
+
+
+def _needs_full_fetch(item: RawListingItem) -> bool:
+    """Política padrão: só dispensa o fetch se o item já traz conteúdo."""
+
+    return not item.content
+
+
 class PaginatedHttpFetcher:
     """Busca páginas de listagem com suporte a paginação simples."""
 
@@ -33,26 +142,29 @@ class PaginatedHttpFetcher:
         self._client = client
         self._timeout = timeout
         self._headers = dict(headers or {})
+        # Argumentos pré-resolvidos: o hot loop não reavalia
+        # ``headers or None`` a cada requisição.
+        self._headers_arg = (
+            MappingProxyType(self._headers) if self._headers else None
+        )
 
-    def fetch(self, url: str, pagination: Mapping[str, object] | None = None) -> Iterable[_FetchedPage]:
-        requests = list(self._build_requests(url, pagination))
-        results: list[_FetchedPage] = []
-        for request_url, params, meta in requests:
+    def fetch(self, url: str, pagination: Mapping[str, object] | None = None) -> Iterator[_FetchedPage]:
+        # Gerador: apenas uma página de listagem fica viva por vez.
+        for request_url, params, meta in self._build_requests(url, pagination):
             try:
                 response = self._client.get(
                     request_url,
                     params=params,
                     timeout=self._timeout,
-                    headers=self._headers or None,
+                    headers=self._headers_arg,
                 )
                 response.raise_for_status()
             except Exception as exc:  # noqa: BLE001
                 raise FetchError("Falha ao buscar página de listagem", cause=exc) from exc
 
-            html = getattr(response, "text", "")
+            html = _response_payload(response)
             final_url = str(getattr(response, "url", request_url))
-            results.append(_FetchedPage(html=html, url=final_url, metadata=meta))
-        return results
+            yield _FetchedPage(html=html, url=final_url, metadata=meta)
 
     def _build_requests(
         self, url: str, pagination: Mapping[str, object] | None
@@ -99,29 +211,86 @@ class SoupListingParser:
         title_selector: str | None = None,
         summary_selector: str | None = None,
         metadata_selectors: Mapping[str, Mapping[str, object] | str] | None = None,
+        include_content: bool = False,
     ) -> None:
         self._item_selector = item_selector
-        self._link_selector = link_selector
+        # ``include_content`` re-serializa o subtree do item (caminho de
+        # parse inline); o padrão continua ``content=None``.
+        self._include_content = include_content
+        # Seletores vazios (ou só espaços) são descartados aqui: o loop
+        # por item nunca testa configuração morta.
+        self._link_selector = (link_selector or "").strip()
         self._url_attribute = url_attribute
-        self._title_selector = title_selector
-        self._summary_selector = summary_selector
+        self._title_selector = (title_selector or "").strip() or None
+        self._summary_selector = (summary_selector or "").strip() or None
+        link_selector = self._link_selector
+        title_selector = self._title_selector
+        summary_selector = self._summary_selector
+        # Seletores compilados uma vez por instância: cada elemento da
+        # listagem consulta direto a forma tokenizada.
+        self._item_compiled = compile_selector(item_selector)
+        self._link_compiled = compile_selector(link_selector) if link_selector else None
+        self._title_compiled = (
+            compile_selector(title_selector) if title_selector else None
+        )
+        self._summary_compiled = (
+            compile_selector(summary_selector) if summary_selector else None
+        )
         self._metadata_selectors = {
             key: (value if isinstance(value, Mapping) else {"selector": value})
             for key, value in (metadata_selectors or {}).items()
         }
+        # Opções pré-digeridas uma única vez; os seletores em si são
+        # compilados e memoizados pelo cache de ``html_tree``.
+        self._meta_specs = _build_meta_specs(self._metadata_selectors)
+        # Consultas fundidas: uma única descida pela subárvore do item
+        # responde link, título, resumo e todos os metadados. Cada
+        # consulta é endereçada por índice no vetor de resultados.
+        queries: list[tuple[tuple[Any, ...], bool]] = []
+        self._q_link = self._q_title = self._q_summary = -1
+        if self._link_compiled is not None:
+            self._q_link = len(queries)
+            queries.append((self._link_compiled, True))
+        if self._title_compiled is not None:
+            self._q_title = len(queries)
+            queries.append((self._title_compiled, True))
+        if self._summary_compiled is not None:
+            self._q_summary = len(queries)
+            queries.append((self._summary_compiled, True))
+        self._spec_queries = tuple(
+            (len(queries) + offset, spec)
+            for offset, spec in enumerate(self._meta_specs)
+        )
+        queries.extend((spec.compiled, not spec.collect_all) for spec in self._meta_specs)
+        self._fused_queries = tuple(queries)
 
     def extract(
         self,
-        html: str,
+        html: str | bytes,
         *,
         base_url: str,
         page_metadata: Mapping[str, object] | None = None,
     ) -> Iterable[RawListingItem]:
         soup = HTMLDocument.from_html(html)
-        items = soup.select(self._item_selector)
-        results: list[RawListingItem] = []
+        items = soup.select_compiled(self._item_compiled)
+        fused_queries = self._fused_queries
         for element in items:
-            link_element = element.select_one(self._link_selector) if self._link_selector else element
+            # Uma única descida pela subárvore responde todas as
+            # consultas; cada nó é testado contra os seletores pendentes.
+            found: list[list[HTMLNode]] = [[] for _ in fused_queries]
+            for node in element.iter_descendants(include_self=False):
+                for index, (compiled, first_only) in enumerate(fused_queries):
+                    bucket = found[index]
+                    if first_only and bucket:
+                        continue
+                    if match_selector(node, compiled):
+                        bucket.append(node)
+
+            if self._q_link >= 0:
+                link_nodes = found[self._q_link]
+                link_element = link_nodes[0] if link_nodes else None
+            else:
+                link_element = element
             href = (link_element.get(self._url_attribute, "") if link_element else "").strip()
             if not href:
                 continue
@@ -130,52 +299,25 @@ class SoupListingParser:
                 link_text = link_element.get_text(" ", strip=True)
                 if link_text and "title" not in metadata:
                     metadata["title"] = link_text
-            if self._title_selector:
-                title_node = element.select_one(self._title_selector)
-                if title_node and (title_text := title_node.get_text(" ", strip=True)):
+            if self._q_title >= 0 and (title_nodes := found[self._q_title]):
+                if title_text := title_nodes[0].get_text(" ", strip=True):
                     metadata.setdefault("title", title_text)
-            if self._summary_selector:
-                summary_node = element.select_one(self._summary_selector)
-                if summary_node:
-                    metadata.setdefault("summary_html", str(summary_node))
-                    metadata.setdefault("summary_text", summary_node.get_text(" ", strip=True))
-            for key, options in self._metadata_selectors.items():
-                value = self._extract_metadata(element, options)
+            if self._q_summary >= 0 and (summary_nodes := found[self._q_summary]):
+                summary_node = summary_nodes[0]
+                metadata.setdefault("summary_html", str(summary_node))
+                metadata.setdefault("summary_text", summary_node.get_text(" ", strip=True))
+            for index, spec in self._spec_queries:
+                value = _metadata_from_nodes(found[index], spec)
                 if value is not None:
-                    metadata[key] = value
-            results.append(
-                RawListingItem(
-                    url=href,
-                    content=str(element),
-                    metadata=metadata,
-                )
+                    metadata[spec.key] = value
+            # Por padrão o conteúdo da listagem não é consumido (o artigo
+            # é rebuscado pela URL) e a serialização é pulada; com
+            # ``include_content`` o subtree alimenta o parse inline.
+            yield RawListingItem(
+                url=href,
+                content=str(element) if self._include_content else None,
+                metadata=metadata,
             )
-        return results
-
-    def _extract_metadata(self, element: HTMLNode, options: Mapping[str, object]) -> object | None:
-        selector = str(options.get("selector", "")).strip()
-        if not selector:
-            return None
-        attr = options.get("attr")
-        collect_all = bool(options.get("all"))
-        if collect_all:
-            nodes = element.select(selector)
-        else:
-            node = element.select_one(selector)
-            nodes = [node] if node else []
-        if not nodes:
-            return None
-        values: list[object] = []
-        for node in nodes:
-            if attr == "html":
-                values.append(str(node))
-            elif isinstance(attr, str) and attr:
-                values.append(node.get(attr))
-            else:
-                values.append(node.get_text(" ", strip=True))
-        if collect_all:
-            return tuple(value for value in values if value is not None)
-        return next((value for value in values if value is not None), None)
 
 
 class SoupArticleParser(Parser):
@@ -189,27 +331,32 @@ class SoupArticleParser(Parser):
         metadata_selectors: Mapping[str, Mapping[str, object] | str] | None = None,
     ) -> None:
         self._body_selector = body_selector
-        self._title_selector = title_selector
+        self._title_selector = (title_selector or "").strip() or None
+        self._body_compiled = compile_selector(body_selector)
+        self._title_compiled = (
+            compile_selector(self._title_selector) if self._title_selector else None
+        )
         self._metadata_selectors = {
             key: (value if isinstance(value, Mapping) else {"selector": value})
             for key, value in (metadata_selectors or {}).items()
         }
+        self._meta_specs = _build_meta_specs(self._metadata_selectors)
 
     def parse(self, item: RawListingItem) -> RawArticle:
-        soup = HTMLDocument.from_html(item.content)
-        body_node = soup.select_one(self._body_selector)
+        soup = HTMLDocument.from_html(item.content or "")
+        body_node = soup.select_one_compiled(self._body_compiled)
         if not body_node:
             raise ParseError("Não foi possível localizar o corpo do artigo")
 
         metadata = dict(item.metadata)
-        if self._title_selector:
-            title_node = soup.select_one(self._title_selector)
+        if self._title_compiled is not None:
+            title_node = soup.select_one_compiled(self._title_compiled)
             if title_node and (title_text := title_node.get_text(" ", strip=True)):
                 metadata.setdefault("title", title_text)
-        for key, options in self._metadata_selectors.items():
-            value = self._extract_metadata(soup, options)
+        for spec in self._meta_specs:
+            value = _extract_metadata_spec(soup, spec)
             if value is not None:
-                metadata[key] = value
+                metadata[spec.key] = value
 
         title_value = metadata.get("title")
         if title_value is not None:
@@ -222,31 +369,6 @@ class SoupArticleParser(Parser):
             metadata=metadata,
         )
 
-    def _extract_metadata(self, soup: HTMLDocument, options: Mapping[str, object]) -> object | None:
-        selector = str(options.get("selector", "")).strip()
-        if not selector:
-            return None
-        attr = options.get("attr")
-        collect_all = bool(options.get("all"))
-        if collect_all:
-            nodes = soup.select(selector)
-        else:
-            node = soup.select_one(selector)
-            nodes = [node] if node else []
-        if not nodes:
-            return None
-        values: list[object] = []
-        for node in nodes:
-            if attr == "html":
-                values.append(str(node))
-            elif isinstance(attr, str) and attr:
-                values.append(node.get(attr))
-            else:
-                values.append(node.get_text(" ", strip=True))
-        if collect_all:
-            return tuple(value for value in values if value is not None)
-        return next((value for value in values if value is not None), None)
-
 
 class RequestsSoupScraper(ScraperProtocol):
     """Implementação padrão do protocolo de scraper para portais HTML."""
@@ -261,43 +383,114 @@ class RequestsSoupScraper(ScraperProtocol):
         pagination: Mapping[str, object] | None = None,
         request_timeout: float | None = None,
         headers: Mapping[str, str] | None = None,
+        max_workers: int = 1,
+        max_in_flight: int | None = None,
+        parse_workers: int = 0,
+        inline_parser: Parser | None = None,
+        should_fetch_full: Callable[[RawListingItem], bool] | None = None,
     ) -> None:
         self._url_normalizer = url_normalizer
         self._listing_parser = listing_parser
         self._article_parser = article_parser
-        self._fetcher = PaginatedHttpFetcher(
-            client,
-            timeout=request_timeout,
-            headers=headers,
+        # Parse inline: quando a listagem já traz o corpo do artigo,
+        # ``inline_parser`` evita uma requisição HTTP por item. A política
+        # padrão só dispensa o fetch se o item tiver ``content``.
+        self._inline_parser = inline_parser
+        self._should_fetch_full = (
+            should_fetch_full if should_fetch_full is not None else _needs_full_fetch
         )
-        self._client = client
         self._pagination = pagination or {}
         self._request_timeout = request_timeout
         self._headers = dict(headers or {})
+        # Fan-out de artigos: com max_workers > 1 o client injetado
+        # precisa ser thread-safe (requests.Session é).
+        self._max_workers = max(int(max_workers), 1)
+        self._max_in_flight = (
+            max(int(max_in_flight), 1) if max_in_flight else self._max_workers * 2
+        )
+        # Parse em processos (opt-in): tira o parse HTML, limitado por CPU,
+        # de baixo do GIL. Exige um article_parser picklável; o padrão
+        # (0) mantém tudo no processo atual.
+        self._parse_workers = max(int(parse_workers), 0)
+        client, self._owns_client = self._prepare_client(client)
+        self._client = client
+        # Resolvido após _prepare_client (que pode mover os headers para a
+        # Session): evita recalcular ``headers or None`` por artigo.
+        self._headers_arg = (
+            MappingProxyType(self._headers) if self._headers else None
+        )
+        self._fetcher = PaginatedHttpFetcher(
+            client,
+            timeout=request_timeout,
+            headers=self._headers,
+        )
+
+    def _prepare_client(self, client: Any) -> tuple[Any, bool]:
+        """Promove o módulo ``requests`` cru a uma ``Session`` com pool.
+
+        Sem Session cada ``get`` pode pagar DNS e handshake TLS; o pool é
+        dimensionado pelo fan-out configurado e os headers fixos passam a
+        viver na própria sessão em vez de serem repassados por chamada.
+        Clients já instanciados são usados como estão.
+        """
+
+        if not isinstance(client, ModuleType) or not hasattr(client, "Session"):
+            return client, False
+        session = client.Session()
+        try:
+            adapter = client.adapters.HTTPAdapter(
+                pool_connections=self._max_workers,
+                pool_maxsize=self._max_workers * 2,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        except Exception:  # noqa: BLE001, S110 - pool padrão da Session
+            pass
+        if self._headers:
+            session.headers.update(self._headers)
+            self._headers = {}
+        return session, True
+
+    def close(self) -> None:
+        """Libera o pool de conexões quando a sessão foi criada aqui."""
+
+        if self._owns_client:
+            close = getattr(self._client, "close", None)
+            if close is not None:
+                close()
+
+    def __enter__(self) -> RequestsSoupScraper:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def fetch_page(self, page: Mapping[str, object]) -> Iterable[ScrapedItem]:
         page_metadata = self._to_metadata(page.get("metadata"))
         page_url = str(page.get("url", ""))
         pagination = page.get("pagination") or self._pagination
         items: list[ScrapedItem] = []
-        for listing_item in self.iter_listing(page_url, page_metadata, pagination):
-            try:
-                raw_article = self.fetch_and_parse_article(listing_item, page_metadata)
-            except ParseError:
-                raise
-            except FetchError:
-                raise
-            except Exception as exc:  # noqa: BLE001
-                raise ParseError("Erro inesperado ao processar artigo", cause=exc) from exc
-
-            metadata = dict(page_metadata)
-            metadata.update(listing_item.metadata)
-            metadata.update(raw_article.metadata)
+        listing_items = self._iter_listing(page_url, page_metadata, pagination)
+        for listing_item, raw_article in self._iter_parsed_articles(
+            listing_items, page_metadata
+        ):
+            # ChainMap em vez de duas cópias + updates: as consultas abaixo
+            # resolvem por precedência (artigo > listagem > página) sem
+            # materializar o merge; o dict só é construído uma vez, na
+            # fronteira do ScrapedItem.
+            merged = ChainMap(
+                raw_article.metadata, listing_item.metadata, page_metadata
+            )
 
-            title = raw_article.title or metadata.get("title")
-            summary_html = metadata.get("summary_html")
-            tags = self._normalize_tags(metadata.get("tags"))
-            published_at = metadata.get("published_at")
+            title = raw_article.title or merged.get("title")
+            summary_html = merged.get("summary_html")
+            tags = self._normalize_tags(merged.get("tags"))
+            published_at = merged.get("published_at")
             published_str = str(published_at) if published_at is not None else None
 
             items.append(
@@ -308,20 +501,161 @@ class RequestsSoupScraper(ScraperProtocol):
                     summary_html=str(summary_html) if summary_html is not None else None,
                     tags=tags,
                     published_at=published_str,
-                    metadata=metadata,
+                    metadata=dict(merged),
                 )
             )
         return items
 
+    def _iter_parsed_articles(
+        self,
+        listing_items: Iterable[RawListingItem],
+        page_metadata: Mapping[str, object],
+    ) -> Iterator[tuple[RawListingItem, RawArticle]]:
+        """Busca e parseia artigos, em série ou com fan-out limitado.
+
+        Com ``max_workers > 1`` as buscas (limitadas por rede) correm em
+        um pool de threads com no máximo ``max_in_flight`` futuros
+        pendentes; os resultados são consumidos na ordem da listagem para
+        manter a saída determinística.
+        """
+
+        if self._parse_workers > 0:
+            yield from self._iter_process_parsed(listing_items, page_metadata)
+            return
+
+        if self._max_workers <= 1:
+            for listing_item in listing_items:
+                yield listing_item, self._parse_listing_item(listing_item, page_metadata)
+            return
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            window: deque[tuple[RawListingItem, Any]] = deque()
+            for listing_item in listing_items:
+                window.append(
+                    (
+                        listing_item,
+                        executor.submit(
+                            self._parse_listing_item, listing_item, page_metadata
+                        ),
+                    )
+                )
+                if len(window) >= self._max_in_flight:
+                    item, future = window.popleft()
+                    yield item, future.result()
+            while window:
+                item, future = window.popleft()
+                yield item, future.result()
+
+    def _iter_process_parsed(
+        self,
+        listing_items: Iterable[RawListingItem],
+        page_metadata: Mapping[str, object],
+    ) -> Iterator[tuple[RawListingItem, RawArticle]]:
+        """Fetch no processo atual, parse em um ``ProcessPoolExecutor``.
+
+        O fetch (limitado por rede) continua aqui; o HTML cru é enviado
+        aos workers, que devolvem o ``RawArticle`` pronto. A janela de
+        futuros pendentes limita a memória e a ordem da listagem é
+        preservada no consumo.
+        """
+
+        with ProcessPoolExecutor(
+            max_workers=self._parse_workers,
+            initializer=_init_parse_worker,
+            initargs=(self._article_parser,),
+        ) as pool:
+            window: deque[tuple[RawListingItem, Any, RawArticle | None]] = deque()
+            max_pending = self._parse_workers * 2
+            for listing_item in listing_items:
+                if self._inline_parser is not None and not self._should_fetch_full(
+                    listing_item
+                ):
+                    article: RawArticle | None = self._parse_listing_item(
+                        listing_item, page_metadata
+                    )
+                    window.append((listing_item, None, article))
+                else:
+                    content_item = self._fetch_article_item(
+                        listing_item, page_metadata
+                    )
+                    window.append(
+                        (listing_item, pool.submit(_parse_in_worker, content_item), None)
+                    )
+                if len(window) >= max_pending:
+                    yield self._consume_parse_entry(window.popleft())
+            while window:
+                yield self._consume_parse_entry(window.popleft())
+
+    def _consume_parse_entry(
+        self, entry: tuple[RawListingItem, Any, RawArticle | None]
+    ) -> tuple[RawListingItem, RawArticle]:
+        listing_item, future, article = entry
+        if future is not None:
+            try:
+                article = future.result()
+            except (FetchError, ParseError):
+                raise
+            except Exception as exc:  # noqa: BLE001
+                raise ParseError("Erro inesperado ao processar artigo", cause=exc) from exc
+            article = self._finish_article(article, listing_item)
+        assert article is not None
+        return listing_item, article
+
+    def _parse_listing_item(
+        self,
+        listing_item: RawListingItem,
+        page_metadata: Mapping[str, object],
+    ) -> RawArticle:
+        try:
+            if self._inline_parser is not None and not self._should_fetch_full(
+                listing_item
+            ):
+                return self._parse_inline_article(listing_item, page_metadata)
+            return self.fetch_and_parse_article(listing_item, page_metadata)
+        except (FetchError, ParseError):
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise ParseError("Erro inesperado ao processar artigo", cause=exc) from exc
+
+    def _parse_inline_article(
+        self,
+        listing_item: RawListingItem,
+        page_metadata: Mapping[str, object],
+    ) -> RawArticle:
+        """Parseia o artigo a partir do HTML já presente na listagem."""
+
+        assert self._inline_parser is not None
+        content_item = RawListingItem(
+            url=listing_item.url,
+            content=listing_item.content,
+            metadata={**page_metadata, **listing_item.metadata},
+        )
+        article = self._inline_parser.parse(content_item)
+        if not article.title and listing_item.metadata.get("title"):
+            article.metadata.setdefault("title", listing_item.metadata["title"])
+        return article
+
     def iter_listing(
         self,
         page_url: str,
         page_metadata: Mapping[str, object],
         pagination: Mapping[str, object] | None,
-    ) -> Iterable[RawListingItem]:
-        fetched_pages = self._fetcher.fetch(page_url, pagination)
-        normalized_items: list[RawListingItem] = []
-        for fetched in fetched_pages:
+    ) -> list[RawListingItem]:
+        return list(self._iter_listing(page_url, page_metadata, pagination))
+
+    def _iter_listing(
+        self,
+        page_url: str,
+        page_metadata: Mapping[str, object],
+        pagination: Mapping[str, object] | None,
+    ) -> Iterator[RawListingItem]:
+        # Encadeia fetch -> extract -> normalização sem listas
+        # intermediárias; cada página é descartada antes da próxima.
+        to_absolute = self._url_normalizer.to_absolute
+        # Cache local à chamada: itens repetidos entre páginas (destaques
+        # fixos) não pagam urljoin de novo e não vazam entre execuções.
+        normalized_cache: dict[tuple[str, str], str] = {}
+        for fetched in self._fetcher.fetch(page_url, pagination):
             base_meta = dict(page_metadata)
             base_meta.update(fetched.metadata)
             for item in self._listing_parser.extract(
@@ -329,17 +663,20 @@ class RequestsSoupScraper(ScraperProtocol):
                 base_url=fetched.url,
                 page_metadata=base_meta,
             ):
-                absolute_url = self._url_normalizer.to_absolute(item.url, fetched.url)
-                metadata = dict(item.metadata)
+                cache_key = (item.url, fetched.url)
+                absolute_url = normalized_cache.get(cache_key)
+                if absolute_url is None:
+                    absolute_url = to_absolute(item.url, fetched.url)
+                    normalized_cache[cache_key] = absolute_url
+                # O dict de metadados acabou de ser criado pelo extract e
+                # pertence a este item: reaproveita em vez de copiar.
+                metadata = item.metadata
                 metadata.setdefault("page_url", fetched.url)
-                normalized_items.append(
-                    RawListingItem(
-                        url=absolute_url,
-                        content=item.content,
-                        metadata=metadata,
-                    )
+                yield RawListingItem(
+                    url=absolute_url,
+                    content=item.content,
+                    metadata=metadata,
                 )
-        return normalized_items
 
     def fetch_and_parse_article(
         self,
@@ -350,19 +687,25 @@ class RequestsSoupScraper(ScraperProtocol):
             response = self._client.get(
                 listing_item.url,
                 timeout=self._request_timeout,
-                headers=self._headers or None,
+                headers=self._headers_arg,
             )
             response.raise_for_status()
         except Exception as exc:  # noqa: BLE001
             raise FetchError("Falha ao buscar artigo", cause=exc) from exc
 
-        html = getattr(response, "text", "")
+        html = _response_payload(response)
         content_item = RawListingItem(
             url=listing_item.url,
             content=html,
             metadata={**page_metadata, **listing_item.metadata},
         )
         article = self._article_parser.parse(content_item)
+        return self._finish_article(article, listing_item)
+
+    @staticmethod
+    def _finish_article(
+        article: RawArticle, listing_item: RawListingItem
+    ) -> RawArticle:
         if not article.title and listing_item.metadata.get("title"):
             article.metadata.setdefault("title", listing_item.metadata["title"])
             article = RawArticle(
@@ -373,24 +716,48 @@ class RequestsSoupScraper(ScraperProtocol):
             )
         return article
 
+    def _fetch_article_item(
+        self,
+        listing_item: RawListingItem,
+        page_metadata: Mapping[str, object],
+    ) -> RawListingItem:
+        """Só o fetch do artigo, sem parse: alimenta o pool de processos."""
+
+        try:
+            response = self._client.get(
+                listing_item.url,
+                timeout=self._request_timeout,
+                headers=self._headers_arg,
+            )
+            response.raise_for_status()
+        except Exception as exc:  # noqa: BLE001
+            raise FetchError("Falha ao buscar artigo", cause=exc) from exc
+        return RawListingItem(
+            url=listing_item.url,
+            content=_response_payload(response),
+            metadata={**page_metadata, **listing_item.metadata},
+        )
+
     def _normalize_tags(self, tags: object) -> tuple[str, ...]:
         if tags is None:
             return ()
+        if type(tags) is tuple and all(
+            type(tag) is str and tag and not tag[0].isspace() and not tag[-1].isspace()
+            for tag in tags
+        ):
+            # Tags que já passaram por aqui (ou vieram limpas da config)
+            # voltam por identidade, sem reconstruir a tupla.
+            return tags
         if isinstance(tags, str):
+            # Um split pré-compilado come vírgulas e espaços adjacentes de
+            # uma vez, dispensando o strip() por parte.
+            return tuple(part for part in _TAG_SPLIT.split(tags.strip()) if part)
+        if isinstance(tags, Iterable) and not isinstance(tags, (bytes, str)):
             return tuple(
-                part.strip()
-                for part in tags.split(",")
-                if part and part.strip()
+                cleaned
+                for tag in tags
+                if tag is not None and (cleaned := str(tag).strip())
             )
-        if isinstance(tags, Iterable) and not isinstance(tags, (bytes, str)):
-            normalized = []
-            for tag in tags:
-                if tag is None:
-                    continue
-                cleaned = str(tag).strip()
-                if cleaned:
-                    normalized.append(cleaned)
-            return tuple(normalized)
         return (str(tags),)
 
     def _to_metadata(self, metadata: object) -> Mapping[str, object]:
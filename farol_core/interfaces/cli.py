@@ -4,8 +4,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import Any
@@ -16,6 +20,53 @@ from farol_core.domain.errors import FarolError
 from farol_core.infrastructure.logging.logger import configure_logger
 from farol_core.infrastructure.time.system_clock import SystemClock
 
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import orjson
+except Exception:  # noqa: BLE001 - degradar para json da stdlib
+    orjson = None
+
+
+def _loads_config(path: Path) -> object:
+    """Decodifica o JSON do arquivo, direto dos bytes quando há orjson."""
+
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text("utf-8"))
+
+
+def _loads_pages(raw: str) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_compact(payload: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def _dumps_pretty(payload: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def _is_obj(value: object) -> bool:
+    """Teste de objeto JSON com fast-path para o tipo exato ``dict``.
+
+    O decoder só produz ``dict``; o ``isinstance`` contra a ABC (que
+    percorre o registry) fica como fallback para mapeamentos injetados.
+    """
+
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+def _is_arr(value: object) -> bool:
+    if type(value) is list:
+        return True
+    return isinstance(value, Sequence)
+
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Executor do coletor Farol")
@@ -41,6 +92,11 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Desabilita a etapa de deduplicação de itens.",
     )
+    parser.add_argument(
+        "--warm-dedup",
+        action="store_true",
+        help="Pré-carrega fingerprints persistidos no deduper antes da coleta.",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -49,11 +105,27 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Configurações já validadas, indexadas por (caminho, mtime_ns, tamanho):
+# arquivos intactos entre invocações não pagam I/O nem parse de novo.
+_PORTAL_CACHE: dict[tuple[str, int, int], "PortalConfig"] = {}
+
+
 @dataclass(slots=True)
 class PortalComponentConfig:
     name: str
     factory: str
-    options: Mapping[str, object]
+    # Tipos concretos: ``from_mapping``/``load`` sempre armazenam dict e
+    # tuple, então consumidores usam os métodos C (``copy``) direto, sem
+    # isinstance contra ABCs.
+    options: dict[str, object]
+    # Callable resolvido sob demanda e memoizado na instância: os builds
+    # seguintes não repetem import_module + getattr.
+    factory_callable: Any = field(default=None, compare=False)
+
+    def resolve(self) -> Any:
+        if self.factory_callable is None:
+            self.factory_callable = _import_from_string(self.factory)
+        return self.factory_callable
 
     @classmethod
     def from_mapping(cls, name: str, data: Mapping[str, object]) -> "PortalComponentConfig":
@@ -63,7 +135,7 @@ class PortalComponentConfig:
                 f"Configuração do componente '{name}' inválida: campo 'factory' obrigatório"
             )
         options_raw = data.get("options", {})
-        if not isinstance(options_raw, Mapping):
+        if not _is_obj(options_raw):
             raise RuntimeError(
                 f"Configuração do componente '{name}' inválida: 'options' deve ser um objeto"
             )
@@ -74,9 +146,9 @@ class PortalComponentConfig:
 class PortalConfig:
     name: str
     logger_name: str
-    pages: Sequence[Mapping[str, object]]
-    components: Mapping[str, PortalComponentConfig]
-    metadata: Mapping[str, object]
+    pages: tuple[dict[str, object], ...]
+    components: dict[str, PortalComponentConfig]
+    metadata: dict[str, object]
     source: Path
 
     REQUIRED_COMPONENTS = (
@@ -90,8 +162,29 @@ class PortalConfig:
 
     @classmethod
     def load(cls, path: Path) -> "PortalConfig":
-        data = json.loads(path.read_text("utf-8"))
-        if not isinstance(data, Mapping):
+        """Carrega (com cache por ``mtime``/tamanho) a configuração do portal.
+
+        Execuções repetidas sobre o mesmo diretório — loops de dry-run e
+        suítes de teste — pulam leitura, parse e validação de arquivos
+        que não mudaram desde a última chamada.
+        """
+
+        try:
+            stat = path.stat()
+            cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+        if cache_key is not None and (cached := _PORTAL_CACHE.get(cache_key)):
+            return cached
+        config = cls._load_uncached(path)
+        if cache_key is not None:
+            _PORTAL_CACHE[cache_key] = config
+        return config
+
+    @classmethod
+    def _load_uncached(cls, path: Path) -> "PortalConfig":
+        data = _loads_config(path)
+        if not _is_obj(data):
             raise RuntimeError(
                 f"Conteúdo inválido no arquivo de portal '{path}': esperado objeto JSON"
             )
@@ -105,40 +198,56 @@ class PortalConfig:
             logger_name = f"farol.portal.{name.strip().lower()}"
 
         pages_raw = data.get("pages", [])
-        if not isinstance(pages_raw, Sequence):
+        if not _is_arr(pages_raw):
             raise RuntimeError(
                 f"Configuração inválida no arquivo '{path}': campo 'pages' deve ser uma lista"
             )
-        pages: list[Mapping[str, object]] = []
-        for index, page in enumerate(pages_raw, start=1):
-            if not isinstance(page, Mapping):
-                raise RuntimeError(
-                    f"Configuração inválida no arquivo '{path}': página #{index} deve ser um objeto"
-                )
-            pages.append(dict(page))
 
         components_raw = data.get("components")
-        if not isinstance(components_raw, Mapping):
+        if not _is_obj(components_raw):
             raise RuntimeError(
                 f"Configuração inválida no arquivo '{path}': campo 'components' obrigatório"
             )
         components: dict[str, PortalComponentConfig] = {}
         for required in cls.REQUIRED_COMPONENTS:
             raw_component = components_raw.get(required)
-            if not isinstance(raw_component, Mapping):
+            if not _is_obj(raw_component):
                 raise RuntimeError(
                     f"Configuração inválida no arquivo '{path}': componente '{required}' ausente"
                 )
             components[required] = PortalComponentConfig.from_mapping(required, raw_component)
 
         metadata_raw = data.get("metadata", {})
-        if not isinstance(metadata_raw, Mapping):
+        if not _is_obj(metadata_raw):
             raise RuntimeError(
                 f"Configuração inválida no arquivo '{path}': campo 'metadata' deve ser um objeto"
             )
 
+        # Metadados expandidos uma única vez aqui: ``self.metadata`` é
+        # imutável pela vida do PortalConfig, então cada execução reusa
+        # as páginas já mescladas em vez de refazer o merge por run.
+        portal_name = name.strip()
+        pages: list[dict[str, object]] = []
+        for index, page in enumerate(pages_raw, start=1):
+            if not _is_obj(page):
+                raise RuntimeError(
+                    f"Configuração inválida no arquivo '{path}': página #{index} deve ser um objeto"
+                )
+            page_dict = dict(page)
+            page_metadata = page_dict.get("metadata") or {}
+            if not _is_obj(page_metadata):
+                raise RuntimeError(
+                    f"Configuração inválida no arquivo '{path}': metadados da página #{index} inválidos"
+                )
+            page_dict["metadata"] = {
+                "portal_name": portal_name,
+                **metadata_raw,
+                **page_metadata,
+            }
+            pages.append(page_dict)
+
         return cls(
-            name=name.strip(),
+            name=portal_name,
             logger_name=logger_name,
             pages=tuple(pages),
             components=components,
@@ -155,6 +264,7 @@ class PortalConfig:
         pages_override: Sequence[Mapping[str, object]] | None,
         since: str | None,
         skip_dedup: bool,
+        warm_dedup: bool = False,
     ) -> CollectUseCase:
         pages = self._build_pages(pages_override)
         scraper = self._build_component(
@@ -168,6 +278,8 @@ class PortalConfig:
         text_cleaner = self._build_component("text_cleaner", settings=settings)
         deduper = self._build_deduper(settings=settings, skip_dedup=skip_dedup)
         writer = self._build_component("writer", settings=settings)
+        if warm_dedup:
+            self._warm_deduper(deduper, writer)
 
         return CollectUseCase(
             scraper,
@@ -184,24 +296,30 @@ class PortalConfig:
     def _build_pages(
         self, override: Sequence[Mapping[str, object]] | None
     ) -> Sequence[Mapping[str, object]]:
-        chosen = override if override is not None else self.pages
+        if override is None:
+            # Páginas do arquivo já foram validadas e mescladas no load:
+            # o caminho comum (sem --pages) devolve a tupla como está.
+            return self.pages
         result: list[Mapping[str, object]] = []
-        for index, page in enumerate(chosen, start=1):
-            if not isinstance(page, Mapping):
+        for index, page in enumerate(override, start=1):
+            if not _is_obj(page):
                 raise RuntimeError(
                     f"Página #{index} inválida para o portal '{self.name}': deve ser um objeto"
                 )
             page_dict = dict(page)
-            metadata = page_dict.get("metadata", {})
-            if metadata is None:
-                metadata = {}
-            if not isinstance(metadata, Mapping):
+            metadata = page_dict.get("metadata") or {}
+            if not _is_obj(metadata):
                 raise RuntimeError(
                     f"Metadados da página #{index} inválidos para o portal '{self.name}'"
                 )
-            metadata_dict = {**self.metadata, **dict(metadata)}
-            metadata_dict.setdefault("portal_name", self.name)
-            page_dict["metadata"] = metadata_dict
+            # Um único merge: o default de portal_name entra primeiro e é
+            # sobrescrito por qualquer camada mais específica — mesmo
+            # resultado das três cópias + setdefault de antes.
+            page_dict["metadata"] = {
+                "portal_name": self.name,
+                **self.metadata,
+                **metadata,
+            }
             result.append(page_dict)
         return tuple(result)
 
@@ -214,8 +332,8 @@ class PortalConfig:
         since: str | None = None,
     ) -> Any:
         component_cfg = self.components[component_name]
-        factory = _import_from_string(component_cfg.factory)
-        options = dict(component_cfg.options)
+        factory = component_cfg.resolve()
+        options = component_cfg.options.copy()
         options.setdefault("portal", self)
         options.setdefault("settings", settings)
         if pages is not None:
@@ -234,6 +352,20 @@ class PortalConfig:
             return _NullDeduper()
         return self._build_component("deduper", settings=settings)
 
+    @staticmethod
+    def _warm_deduper(deduper: Any, writer: Any) -> None:
+        """Pré-carrega fingerprints persistidos quando os componentes suportam.
+
+        Sondagem por capacidade, como nos demais pontos de integração:
+        dedupers sem ``warm_from`` ou writers sem coleção exposta seguem
+        sem aquecimento.
+        """
+
+        warm_from = getattr(deduper, "warm_from", None)
+        collection = getattr(writer, "collection", None)
+        if warm_from is not None and collection is not None:
+            warm_from(collection)
+
 
 class _NullDeduper:
     def fingerprint(self, article: Any) -> str:  # pragma: no cover - simples
@@ -243,24 +375,109 @@ class _NullDeduper:
         return True
 
 
+# Parser do argparse construído (uma vez) apenas quando necessário: o
+# caminho comum usa o parser manual abaixo e só delega para o argparse
+# em ``--help``, abreviações e erros de uso.
+@lru_cache(maxsize=1)
+def _arg_parser() -> argparse.ArgumentParser:
+    return _build_parser()
+
+
+# Saída fixa do dry-run: não há nada a serializar por invocação.
+_DRY_RUN_OUTPUT = "[]"
+
+_VALUE_FLAGS = {
+    "--portals-dir": "portals_dir",
+    "--pages": "pages",
+    "--since": "since",
+}
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    """Parser manual para o conjunto mínimo de flags do CLI.
+
+    Montar a tabela de ações do argparse domina o start-up de ``--dry-run``;
+    este loop cobre as flags conhecidas e delega qualquer coisa fora do
+    caminho feliz (``--help``, abreviações, erros) para o argparse, que
+    mantém as mensagens e códigos de saída de sempre.
+    """
+
+    if argv is None:
+        argv = sys.argv[1:]
+    args = argparse.Namespace(
+        configs=[],
+        portals_dir=None,
+        pages=None,
+        since=None,
+        skip_dedup=False,
+        warm_dedup=False,
+        dry_run=False,
+    )
+    index = 0
+    total = len(argv)
+    while index < total:
+        token = argv[index]
+        if token == "--dry-run":
+            args.dry_run = True
+        elif token == "--skip-dedup":
+            args.skip_dedup = True
+        elif token == "--warm-dedup":
+            args.warm_dedup = True
+        elif token == "--":
+            args.configs.extend(argv[index + 1 :])
+            break
+        elif token.startswith("--"):
+            name, eq, value = token.partition("=")
+            dest = _VALUE_FLAGS.get(name)
+            if dest is None:
+                # Flag desconhecida/abreviada ou pedido de ajuda.
+                return _arg_parser().parse_args(argv)
+            if not eq:
+                index += 1
+                if index >= total:
+                    return _arg_parser().parse_args(argv)
+                value = argv[index]
+            setattr(args, dest, value)
+        elif token.startswith("-") and token != "-":
+            return _arg_parser().parse_args(argv)
+        else:
+            args.configs.append(token)
+        index += 1
+    return args
+
+
+@lru_cache(maxsize=None)
+def _default_instance(factory: Any) -> Any:
+    """Constrói (uma vez por factory) o logger/clock padrão do processo.
+
+    A chave é a própria factory: em produção ``configure_logger`` e
+    ``SystemClock`` são estáveis e o resultado é reusado entre chamadas
+    de ``main``; factories trocadas via monkeypatch ganham entradas
+    próprias, então os testes seguem isolados.
+    """
+
+    return factory()
+
+
 def main(argv: Sequence[str] | None = None) -> int:
-    arg_parser = _build_parser()
-    args = arg_parser.parse_args(argv)
+    args = _parse_args(argv)
 
-    settings = load_settings()
-    logger = configure_logger()
-    clock = SystemClock()
+    logger = _default_instance(configure_logger)
+    clock = _default_instance(SystemClock)
 
-    logger.info("cli.start", extra={"extra": {"at": clock.now().isoformat()}})
+    # Um timestamp por fronteira de evento: os logs adjacentes referem o
+    # mesmo instante lógico e não repetem now() + isoformat.
+    start_iso = clock.now().isoformat()
+    logger.info("cli.start", extra={"extra": {"at": start_iso}})
 
     if args.dry_run:
-        logger.info("cli.dry_run", extra={"extra": {"at": clock.now().isoformat()}})
-        print(json.dumps([], ensure_ascii=False, indent=2))
+        logger.info("cli.dry_run", extra={"extra": {"at": start_iso}})
+        print(_DRY_RUN_OUTPUT)
         logger.info(
             "cli.finish",
             extra={
                 "extra": {
-                    "at": clock.now().isoformat(),
+                    "at": start_iso,
                     "count": 0,
                     "dry_run": True,
                 }
@@ -268,6 +485,10 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
         return 0
 
+    # Resolvido só no caminho de coleta: dry-run e erros de parsing não
+    # pagam a leitura de ambiente nem a validação dos settings.
+    settings = load_settings()
+
     try:
         portal_configs = _load_portal_configs(args.configs, args.portals_dir)
     except RuntimeError as exc:
@@ -277,24 +498,32 @@ def main(argv: Sequence[str] | None = None) -> int:
     pages_override = None
     if args.pages is not None:
         try:
-            loaded = json.loads(args.pages)
-        except json.JSONDecodeError as exc:  # noqa: PERF203 - entrada externa
+            loaded = _loads_pages(args.pages)
+        except ValueError as exc:  # noqa: PERF203 - entrada externa
             logger.exception(
-                "cli.pages_invalid", extra={"extra": {"error": exc.msg}}
+                "cli.pages_invalid", extra={"extra": {"error": str(exc)}}
             )
             return 1
-        if not isinstance(loaded, list):
+        if type(loaded) is not list:
             logger.error(
                 "cli.pages_invalid", extra={"extra": {"error": "esperado lista"}}
             )
             return 1
         pages_override = loaded
 
-    results: list[Mapping[str, object]] = []
+    # Saída em streaming: cada resultado é escrito assim que o portal
+    # termina, em vez de acumular tudo e serializar no final — memória
+    # constante e feedback imediato quando um portal é lento.
+    stdout = sys.stdout
+    stdout.write("[")
+    result_count = 0
     exit_code = 0
 
-    for portal_config in portal_configs:
-        portal_logger = configure_logger(portal_config.logger_name)
+    # Loggers por nome, resolvidos uma vez por execução: portais que
+    # compartilham o mesmo logger não repetem o setup.
+    portal_loggers: dict[str, Any] = {}
+
+    def _execute_portal(portal_config: PortalConfig, portal_logger: Any) -> Any:
         portal_logger.info(
             "cli.portal.start",
             extra={
@@ -305,50 +534,81 @@ def main(argv: Sequence[str] | None = None) -> int:
                 }
             },
         )
-        try:
-            use_case = portal_config.build_use_case(
-                settings=settings,
-                clock=clock,
-                logger=portal_logger,
-                pages_override=pages_override,
-                since=args.since,
-                skip_dedup=args.skip_dedup,
+        use_case = portal_config.build_use_case(
+            settings=settings,
+            clock=clock,
+            logger=portal_logger,
+            pages_override=pages_override,
+            since=args.since,
+            skip_dedup=args.skip_dedup,
+            warm_dedup=args.warm_dedup,
+        )
+        return use_case.execute()
+
+    # Portais são independentes e limitados por I/O de rede: as coletas
+    # correm em paralelo e os resultados são consumidos na ordem de
+    # submissão, preservando a ordem (e o streaming) da saída.
+    runs: list[tuple[PortalConfig, Any, Any]] = []
+    with ThreadPoolExecutor(
+        max_workers=min(8, max(len(portal_configs), 1))
+    ) as executor:
+        for portal_config in portal_configs:
+            portal_logger = portal_loggers.get(portal_config.logger_name)
+            if portal_logger is None:
+                portal_logger = configure_logger(portal_config.logger_name)
+                portal_loggers[portal_config.logger_name] = portal_logger
+            runs.append(
+                (
+                    portal_config,
+                    portal_logger,
+                    executor.submit(_execute_portal, portal_config, portal_logger),
+                )
             )
-            result = use_case.execute()
-        except FarolError as exc:
-            portal_logger.exception(
-                "cli.portal.error",
-                extra={"extra": {"error": exc.__class__.__name__}},
+
+        for portal_config, portal_logger, future in runs:
+            try:
+                result = future.result()
+            except FarolError as exc:
+                portal_logger.exception(
+                    "cli.portal.error",
+                    extra={"extra": {"error": exc.__class__.__name__}},
+                )
+                exit_code = 1
+                continue
+            except RuntimeError as exc:
+                portal_logger.exception(
+                    "cli.portal.error",
+                    extra={"extra": {"error": str(exc)}},
+                )
+                exit_code = 1
+                continue
+
+            if result_count:
+                stdout.write(",\n ")
+            result_count += 1
+            stdout.write(
+                _dumps_compact({"portal": portal_config.name, "result": result})
             )
-            exit_code = 1
-            continue
-        except RuntimeError as exc:
-            portal_logger.exception(
-                "cli.portal.error",
-                extra={"extra": {"error": str(exc)}},
+            stdout.flush()
+            portal_logger.info(
+                "cli.portal.finish",
+                extra={
+                    "extra": {
+                        "at": clock.now().isoformat(),
+                        "portal": portal_config.name,
+                        "processed": result.get("metrics", {}).get("processed"),
+                    }
+                },
             )
-            exit_code = 1
-            continue
 
-        results.append({"portal": portal_config.name, "result": result})
-        portal_logger.info(
-            "cli.portal.finish",
-            extra={
-                "extra": {
-                    "at": clock.now().isoformat(),
-                    "portal": portal_config.name,
-                    "processed": result.get("metrics", {}).get("processed"),
-                }
-            },
-        )
-
-    print(json.dumps(results, ensure_ascii=False, indent=2))
+    stdout.write("]\n")
+    stdout.flush()
     logger.info(
         "cli.finish",
         extra={
             "extra": {
                 "at": clock.now().isoformat(),
-                "count": len(results),
+                "count": result_count,
                 "dry_run": False,
             }
         },
@@ -356,6 +616,31 @@ def main(argv: Sequence[str] | None = None) -> int:
     return exit_code
 
 
+def _iter_json_files(root: str):
+    """Percorre o diretório com ``os.scandir`` em vez de ``rglob``.
+
+    ``DirEntry`` reaproveita o ``stat`` que o próprio ``scandir`` já fez,
+    evitando uma segunda syscall por entrada e um ``Path`` por nó
+    visitado.
+    """
+
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file(
+                    follow_symlinks=False
+                ):
+                    yield entry.path
+
+
 def _load_portal_configs(
     config_paths: Sequence[str], portals_dir: str | None
 ) -> Sequence[PortalConfig]:
@@ -367,26 +652,29 @@ def _load_portal_configs(
         paths.append(path)
 
     if portals_dir:
-        dir_path = Path(portals_dir)
-        if not dir_path.exists():
+        if not os.path.exists(portals_dir):
             raise RuntimeError(f"Diretório de portais inexistente: {portals_dir}")
-        for file_path in dir_path.rglob("*.json"):
-            if file_path.is_file():
-                paths.append(file_path)
+        paths.extend(Path(entry) for entry in sorted(_iter_json_files(portals_dir)))
 
     if not paths:
         raise RuntimeError("Nenhum portal informado")
 
-    unique_paths = []
-    seen: set[Path] = set()
-    for path in paths:
-        if path not in seen:
-            unique_paths.append(path)
-            seen.add(path)
+    # dict.fromkeys dedupa preservando a ordem em uma passada só; o
+    # realpath também colapsa duplicatas via symlink.
+    unique_paths = [
+        Path(real)
+        for real in dict.fromkeys(os.path.realpath(str(path)) for path in paths)
+    ]
 
-    return [PortalConfig.load(path) for path in unique_paths]
+    if len(unique_paths) <= 1:
+        return [PortalConfig.load(path) for path in unique_paths]
+    # Cargas independentes: leituras de disco se sobrepõem no pool e a
+    # ordem dos resultados segue a ordem dos caminhos.
+    with ThreadPoolExecutor(max_workers=min(32, len(unique_paths))) as executor:
+        return list(executor.map(PortalConfig.load, unique_paths))
 
 
+@lru_cache(maxsize=None)
 def _import_from_string(path: str) -> Any:
     module_name, sep, attr = path.partition(":")
     if not sep:
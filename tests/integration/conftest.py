@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import orjson
+except Exception:  # noqa: BLE001 - degradar para json da stdlib
+    orjson = None
+
+
+def _dumps_bytes(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _write_portal_config(
+    base_dir: Path,
+    *,
+    name: str,
+    pages: list[dict[str, object]],
+    items: dict[str, list[dict[str, object]]],
+    deduper_options: dict[str, object] | None = None,
+) -> Path:
+    config = {
+        "name": name,
+        "logger": f"test.{name.lower()}",
+        "pages": pages,
+        "metadata": {"segment": "test"},
+        "components": {
+            "scraper": {
+                "factory": "tests.integration.doubles:build_scraper",
+                "options": {"items": items},
+            },
+            "url_normalizer": {
+                "factory": "tests.integration.doubles:build_url_normalizer"
+            },
+            "date_normalizer": {
+                "factory": "tests.integration.doubles:build_date_normalizer"
+            },
+            "text_cleaner": {
+                "factory": "tests.integration.doubles:build_text_cleaner"
+            },
+            "deduper": {
+                "factory": "tests.integration.doubles:build_deduper",
+                "options": deduper_options or {},
+            },
+            "writer": {
+                "factory": "tests.integration.doubles:build_writer"
+            },
+        },
+    }
+    path = base_dir / f"{name}.json"
+    # write_bytes evita a camada de texto (encode + buffer) do write_text;
+    # com orjson o payload já nasce em bytes.
+    path.write_bytes(_dumps_bytes(config))
+    return path
+
+
+@pytest.fixture(scope="session")
+def write_portal_config() -> Callable[..., Path]:
+    """Factory de configs de portal compartilhada pelos testes de CLI."""
+
+    return _write_portal_config
+
+
+@pytest.fixture(scope="session")
+def portal_pair(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Par PortalA/PortalB padrão, escrito uma única vez por sessão.
+
+    Os arquivos nunca são mutados pelos testes; promover a escrita (e a
+    serialização JSON) ao escopo de sessão amortiza o custo entre todos
+    os testes que só precisam das formas padrão.
+    """
+
+    base_dir = tmp_path_factory.mktemp("portals")
+    portal_a = _write_portal_config(
+        base_dir,
+        name="PortalA",
+        pages=[{"url": "https://example.com/a"}],
+        items={
+            "https://example.com/a": [
+                {
+                    "url": "/item-a",
+                    "title": "Item A",
+                    "content_html": "<p>conteudo A</p>",
+                    "published_at": "2024-01-01T09:00:00",
+                }
+            ]
+        },
+    )
+    portal_b = _write_portal_config(
+        base_dir,
+        name="PortalB",
+        pages=[{"url": "https://example.com/b"}],
+        items={
+            "https://example.com/b": [
+                {
+                    "url": "/item-b",
+                    "title": "Item B",
+                    "content_html": "<p>conteudo B</p>",
+                }
+            ]
+        },
+    )
+    return {"A": portal_a, "B": portal_b}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -10,7 +11,9 @@ from typing import Any
 from farol_core.application.collect_usecase import RequestsSoupScraper, ScrapedItem
 from farol_core.domain.contracts import ArticleInput, ArticleWriteResult
 
-CREATED_COMPONENTS: dict[str, dict[str, object]] = {}
+# defaultdict dispensa o setdefault (e o dict temporário descartado em
+# cada hit) no caminho quente de _register.
+CREATED_COMPONENTS: defaultdict[str, dict[str, object]] = defaultdict(dict)
 
 
 def reset_components() -> None:
@@ -20,7 +23,7 @@ def reset_components() -> None:
 
 
 def _register(portal_name: str, component: str, instance: object) -> object:
-    CREATED_COMPONENTS.setdefault(portal_name, {})[component] = instance
+    CREATED_COMPONENTS[portal_name][component] = instance
     return instance
 
 
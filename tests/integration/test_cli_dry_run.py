@@ -5,6 +5,17 @@ import pytest
 
 from farol_core.interfaces import cli
 
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import orjson
+except Exception:  # noqa: BLE001 - degradar para json da stdlib
+    orjson = None
+
+
+def _loads(raw: str) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class _LoggerStub:
     def __init__(self) -> None:
@@ -49,7 +60,7 @@ def test_cli_main_dry_run(
     assert exit_code == 0
 
     captured = capsys.readouterr()
-    assert json.loads(captured.out) == []
+    assert _loads(captured.out) == []
 
     messages = [message for message, _ in logger.info_calls]
     assert "cli.start" in messages
@@ -1,22 +1,42 @@
 from __future__ import annotations
 
 import json
+from collections import deque
 from datetime import datetime
 from pathlib import Path
+from types import ModuleType
 from typing import Callable
 
 import pytest
 
-from farol_core.interfaces import cli
 from tests.integration.doubles import CREATED_COMPONENTS, reset_components
 
+try:  # pragma: no cover - dependência opcional em tempo de execução
+    import orjson
+except Exception:  # noqa: BLE001 - degradar para json da stdlib
+    orjson = None
+
+
+def _dumps(payload: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload)
+
+
+def _loads(raw: str) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class _LoggerStub:
     def __init__(self, name: str) -> None:
         self.name = name
-        self.info_calls: list[tuple[str, dict[str, object]]] = []
-        self.error_calls: list[tuple[str, dict[str, object]]] = []
-        self.exception_calls: list[tuple[str, dict[str, object]]] = []
+        # deque tem append O(1) sem realocação; os testes só iteram sobre
+        # as chamadas ao final, então a troca é transparente.
+        self.info_calls: deque[tuple[str, dict[str, object]]] = deque()
+        self.error_calls: deque[tuple[str, dict[str, object]]] = deque()
+        self.exception_calls: deque[tuple[str, dict[str, object]]] = deque()
 
     def info(self, message: str, *, extra: dict[str, object]) -> None:
         self.info_calls.append((message, extra))
@@ -36,104 +56,73 @@ class _ClockStub:
         return self._now
 
 
-def _configure_logger_stub() -> tuple[dict[str, _LoggerStub], Callable[[str], _LoggerStub]]:
-    loggers: dict[str, _LoggerStub] = {}
-
-    def factory(name: str = "farol") -> _LoggerStub:
-        if name not in loggers:
-            loggers[name] = _LoggerStub(name)
-        return loggers[name]
-
-    return loggers, factory
-
-
-def _write_portal_config(
-    base_dir: Path,
-    *,
-    name: str,
-    pages: list[dict[str, object]],
-    items: dict[str, list[dict[str, object]]],
-    deduper_options: dict[str, object] | None = None,
-) -> Path:
-    config = {
-        "name": name,
-        "logger": f"test.{name.lower()}",
-        "pages": pages,
-        "metadata": {"segment": "test"},
-        "components": {
-            "scraper": {
-                "factory": "tests.integration.doubles:build_scraper",
-                "options": {"items": items},
-            },
-            "url_normalizer": {
-                "factory": "tests.integration.doubles:build_url_normalizer"
-            },
-            "date_normalizer": {
-                "factory": "tests.integration.doubles:build_date_normalizer"
-            },
-            "text_cleaner": {
-                "factory": "tests.integration.doubles:build_text_cleaner"
-            },
-            "deduper": {
-                "factory": "tests.integration.doubles:build_deduper",
-                "options": deduper_options or {},
-            },
-            "writer": {
-                "factory": "tests.integration.doubles:build_writer"
-            },
-        },
-    }
-    path = base_dir / f"{name}.json"
-    path.write_text(json.dumps(config), encoding="utf-8")
-    return path
+class _LoggerFactory:
+    """Substituto de ``configure_logger`` reusado por todos os testes.
 
+    Uma única instância no módulo evita reconstruir closure + dict por
+    teste; o fixture autouse abaixo limpa o registro entre execuções.
+    """
+
+    def __init__(self) -> None:
+        self.loggers: dict[str, _LoggerStub] = {}
+
+    def __call__(self, name: str = "farol") -> _LoggerStub:
+        logger = self.loggers.get(name)
+        if logger is None:
+            logger = self.loggers[name] = _LoggerStub(name)
+        return logger
+
+    def clear(self) -> None:
+        self.loggers.clear()
+
+
+_LOGGER_FACTORY = _LoggerFactory()
+
+
+@pytest.fixture(autouse=True)
+def _reset_logger_factory() -> None:
+    _LOGGER_FACTORY.clear()
+
+
+@pytest.fixture(scope="module")
+def cli() -> ModuleType:
+    """Importa a CLI só quando o módulo realmente executa.
+
+    Manter o import fora do topo evita carregar o pacote inteiro durante
+    a coleta do pytest em execuções segmentadas (``-k``/``-x``); após o
+    primeiro teste o custo é um hit em ``sys.modules``.
+    """
+
+    from farol_core.interfaces import cli
+
+    return cli
+
+
+@pytest.fixture
+def patched_cli(cli: ModuleType, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """CLI com logger/relógio estubados e registro de componentes limpo.
+
+    Concentra o par de ``setattr`` (e o ``reset_components``) num único
+    fixture em vez de repeti-lo em cada teste.
+    """
 
-def test_cli_processa_multiplos_portais(
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-    capsys: pytest.CaptureFixture[str],
-) -> None:
     reset_components()
-    logger_registry, logger_factory = _configure_logger_stub()
-    monkeypatch.setattr(cli, "configure_logger", logger_factory)
+    monkeypatch.setattr(cli, "configure_logger", _LOGGER_FACTORY)
     monkeypatch.setattr(cli, "SystemClock", lambda: _ClockStub())
+    return cli
 
-    portal_a = _write_portal_config(
-        tmp_path,
-        name="PortalA",
-        pages=[{"url": "https://example.com/a"}],
-        items={
-            "https://example.com/a": [
-                {
-                    "url": "/item-a",
-                    "title": "Item A",
-                    "content_html": "<p>conteudo A</p>",
-                    "published_at": "2024-01-01T09:00:00",
-                }
-            ]
-        },
-    )
-    portal_b = _write_portal_config(
-        tmp_path,
-        name="PortalB",
-        pages=[{"url": "https://example.com/b"}],
-        items={
-            "https://example.com/b": [
-                {
-                    "url": "/item-b",
-                    "title": "Item B",
-                    "content_html": "<p>conteudo B</p>",
-                }
-            ]
-        },
-    )
 
-    exit_code = cli.main([str(portal_a), str(portal_b)])
+def test_cli_processa_multiplos_portais(
+    patched_cli: ModuleType,
+    portal_pair: dict[str, Path],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    exit_code = patched_cli.main([str(portal_pair["A"]), str(portal_pair["B"])])
 
     assert exit_code == 0
 
     captured = capsys.readouterr()
-    payload = json.loads(captured.out)
+    payload = _loads(captured.out)
     assert [entry["portal"] for entry in payload] == ["PortalA", "PortalB"]
     assert payload[0]["result"]["metrics"]["processed"] == 1
     assert payload[1]["result"]["metrics"]["processed"] == 1
@@ -144,19 +133,16 @@ def test_cli_processa_multiplos_portais(
 
     assert any(
         message == "cli.portal.finish"
-        for message, _ in logger_registry["test.portala"].info_calls
+        for message, _ in _LOGGER_FACTORY.loggers["test.portala"].info_calls
     )
 
 
 def test_cli_override_de_paginas(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    patched_cli: ModuleType,
+    tmp_path: Path,
+    write_portal_config: Callable[..., Path],
 ) -> None:
-    reset_components()
-    _, logger_factory = _configure_logger_stub()
-    monkeypatch.setattr(cli, "configure_logger", logger_factory)
-    monkeypatch.setattr(cli, "SystemClock", lambda: _ClockStub())
-
-    portal = _write_portal_config(
+    portal = write_portal_config(
         tmp_path,
         name="PortalPages",
         pages=[{"url": "https://example.com/default", "metadata": {"section": "default"}}],
@@ -167,7 +153,7 @@ def test_cli_override_de_paginas(
         {"url": "https://override.com/page", "metadata": {"section": "override"}}
     ]
 
-    exit_code = cli.main([str(portal), "--pages", json.dumps(override_pages)])
+    exit_code = patched_cli.main([str(portal), "--pages", _dumps(override_pages)])
 
     assert exit_code == 0
 
@@ -178,16 +164,12 @@ def test_cli_override_de_paginas(
 
 
 def test_cli_skip_dedup(
-    monkeypatch: pytest.MonkeyPatch,
+    patched_cli: ModuleType,
     tmp_path: Path,
+    write_portal_config: Callable[..., Path],
     capsys: pytest.CaptureFixture[str],
 ) -> None:
-    reset_components()
-    _, logger_factory = _configure_logger_stub()
-    monkeypatch.setattr(cli, "configure_logger", logger_factory)
-    monkeypatch.setattr(cli, "SystemClock", lambda: _ClockStub())
-
-    portal = _write_portal_config(
+    portal = write_portal_config(
         tmp_path,
         name="PortalDedup",
         pages=[{"url": "https://example.com/dedup"}],
@@ -208,11 +190,11 @@ def test_cli_skip_dedup(
         deduper_options={"fingerprint_field": "title"},
     )
 
-    exit_code = cli.main([str(portal), "--skip-dedup"])
+    exit_code = patched_cli.main([str(portal), "--skip-dedup"])
 
     assert exit_code == 0
     captured = capsys.readouterr()
-    payload = json.loads(captured.out)
+    payload = _loads(captured.out)
     assert payload[0]["result"]["metrics"]["processed"] == 2
     assert "deduper" not in CREATED_COMPONENTS["PortalDedup"]
 
@@ -1,13 +1,17 @@
+import hashlib
 from datetime import datetime
+from functools import lru_cache
 
-from farol_core.domain.contracts import ArticleInput
-from datetime import datetime
+import pytest
 
 from farol_core.domain.contracts import ArticleInput
 from farol_core.infrastructure.hashing.sha256_deduper import Sha256Deduper
 
 
+@lru_cache(maxsize=None)
 def _article(url: str, title: str, *, tags: tuple[str, ...] = ("tag",)) -> ArticleInput:
+    # ArticleInput é congelado: instâncias idênticas podem ser
+    # compartilhadas entre os testes em vez de reconstruídas.
     return ArticleInput(
         url=url,
         title=title,
@@ -22,6 +26,17 @@ def _article(url: str, title: str, *, tags: tuple[str, ...] = ("tag",)) -> Artic
     )
 
 
+def test_fingerprint_defaults_to_sha256() -> None:
+    # Fingerprints são persistidos: o algoritmo padrão não pode mudar sem
+    # invalidar o histórico já gravado pelo writer.
+    deduper = Sha256Deduper(fields=("url",))
+
+    article = _article("https://example.com/a", "Titulo")
+    expected = hashlib.sha256("␟https://example.com/a".encode()).hexdigest()
+
+    assert deduper.fingerprint(article) == expected
+
+
 def test_fingerprint_changes_when_relevant_fields_change() -> None:
     deduper = Sha256Deduper(fields=("url", "title"))
 
@@ -48,3 +63,76 @@ def test_factory_accepts_fields_as_string() -> None:
     article_b = _article("https://example.com/b", "Titulo", tags=("a", "b"))
 
     assert deduper.fingerprint(article_a) == deduper.fingerprint(article_b)
+
+
+@pytest.fixture(scope="session")
+def bulk_fingerprints() -> list[str]:
+    # Pré-computados uma vez por sessão: o sweep abaixo mede só o
+    # caminho de inserção/consulta do deduper, não o custo de hashing.
+    return [hashlib.sha256(str(index).encode()).hexdigest() for index in range(10_000)]
+
+
+def test_is_new_handles_bulk_fingerprints(bulk_fingerprints: list[str]) -> None:
+    deduper = Sha256Deduper()
+
+    assert all(deduper.is_new(fingerprint) for fingerprint in bulk_fingerprints)
+    assert not any(deduper.is_new(fingerprint) for fingerprint in bulk_fingerprints)
+
+
+def test_warm_from_preloads_persisted_fingerprints() -> None:
+    deduper = Sha256Deduper()
+    fingerprint = deduper.fingerprint(_article("https://example.com/a", "Titulo"))
+
+    class _CollectionStub:
+        def __init__(self) -> None:
+            self.finds: list[tuple[dict[str, object], dict[str, object]]] = []
+
+        def find(self, filter: dict[str, object], projection: dict[str, object]):
+            self.finds.append((filter, projection))
+            # Documentos com campo vazio não devem contar como carregados.
+            return [{"fingerprint": fingerprint}, {"fingerprint": ""}]
+
+    collection = _CollectionStub()
+
+    loaded = deduper.warm_from(collection)
+
+    assert loaded == 1
+    # Contrato de projeção: só o campo pedido atravessa a rede.
+    assert collection.finds[0] == (
+        {"fingerprint": {"$exists": True}},
+        {"fingerprint": 1, "_id": 0},
+    )
+    # O valor aquecido passa pelo mesmo caminho compacto/shardado do
+    # is_new: o fingerprint pré-carregado não é mais considerado novo.
+    assert deduper.is_new(fingerprint) is False
+
+
+def test_warm_from_stops_on_fingerprints_from_another_algorithm() -> None:
+    # Digest de 32 hex (xxh3) persistido com o SHA-256 ativo: aquecer
+    # não traria acertos, então o scan para sem carregar nada.
+    deduper = Sha256Deduper()
+
+    class _CollectionStub:
+        def find(
+            self, filter: dict[str, object], projection: dict[str, object]
+        ) -> list[dict[str, object]]:
+            return [{"fingerprint": "a" * 32}, {"fingerprint": "b" * 32}]
+
+    assert deduper.warm_from(_CollectionStub()) == 0
+
+
+def test_warm_from_loads_zero_without_find_support() -> None:
+    deduper = Sha256Deduper()
+
+    assert deduper.warm_from(object()) == 0
+
+
+def test_hot_cache_preserves_is_new_semantics(bulk_fingerprints: list[str]) -> None:
+    # A capacidade menor que o lote força evicções: respostas devem ser
+    # idênticas com e sem o cache quente na frente do conjunto.
+    deduper = Sha256Deduper(hot_cache_size=16)
+
+    assert all(deduper.is_new(fingerprint) for fingerprint in bulk_fingerprints[:100])
+    assert not any(
+        deduper.is_new(fingerprint) for fingerprint in bulk_fingerprints[:100]
+    )
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from farol_core.domain.errors import FetchError
+from farol_core.infrastructure.http.httpx_fetcher import (
+    AsyncHttpxFetcher,
+    HttpxFetcher,
+)
+
+
+class _StubResponse:
+    def __init__(self, payload: object) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> object:
+        return self._payload
+
+
+class _StubAsyncClient:
+    def __init__(
+        self,
+        payloads: dict[str, object],
+        *,
+        failing: frozenset[str] = frozenset(),
+    ) -> None:
+        self._payloads = payloads
+        self._failing = failing
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def get(self, url: str) -> _StubResponse:
+        self.calls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Cede o loop algumas vezes para que requisições concorrentes
+        # realmente se sobreponham e o semáforo seja exercitado.
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.in_flight -= 1
+        if url in self._failing:
+            raise RuntimeError(f"HTTP 500 em {url}")
+        return _StubResponse(self._payloads[url])
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _payload_for(name: str) -> dict[str, object]:
+    return {
+        "items": [
+            {"url": f"https://example.com/{name}", "content": f"<p>{name}</p>"}
+        ]
+    }
+
+
+class _StubSyncClient:
+    def __init__(self, payload: object) -> None:
+        self._payload = payload
+
+    def get(self, url: str) -> _StubResponse:
+        return _StubResponse(self._payload)
+
+
+def test_fetch_raises_for_missing_url_at_call_time() -> None:
+    client = _StubSyncClient({"items": [{"content": "<p>sem url</p>"}]})
+    fetcher = HttpxFetcher(client, "https://api.example.com/a")
+
+    # A construção dos itens é preguiçosa, mas o contrato de erro é do
+    # fetch: o campo obrigatório ausente estoura aqui, sem iterar nada.
+    with pytest.raises(FetchError):
+        fetcher.fetch()
+
+
+def test_fetch_many_preserves_input_order() -> None:
+    urls = ["https://api.example.com/a", "https://api.example.com/b"]
+    client = _StubAsyncClient(
+        {urls[0]: _payload_for("a"), urls[1]: _payload_for("b")}
+    )
+    fetcher = AsyncHttpxFetcher(urls, client=client)
+
+    results = asyncio.run(fetcher.fetch_many())
+
+    assert [[item.url for item in listing] for listing in results] == [
+        ["https://example.com/a"],
+        ["https://example.com/b"],
+    ]
+
+
+def test_fetch_many_respects_max_concurrency() -> None:
+    urls = [f"https://api.example.com/{index}" for index in range(6)]
+    client = _StubAsyncClient({url: _payload_for(str(i)) for i, url in enumerate(urls)})
+    fetcher = AsyncHttpxFetcher(urls, client=client, max_concurrency=2)
+
+    asyncio.run(fetcher.fetch_many())
+
+    assert len(client.calls) == 6
+    assert client.max_in_flight <= 2
+
+
+def test_fetch_many_wraps_http_errors_in_fetch_error() -> None:
+    url = "https://api.example.com/falha"
+    client = _StubAsyncClient({}, failing=frozenset({url}))
+    fetcher = AsyncHttpxFetcher([url], client=client)
+
+    with pytest.raises(FetchError):
+        asyncio.run(fetcher.fetch_many())
+
+
+def test_aclose_closes_injected_client() -> None:
+    client = _StubAsyncClient({})
+    fetcher = AsyncHttpxFetcher([], client=client)
+
+    asyncio.run(fetcher.aclose())
+
+    assert client.closed is True
@@ -0,0 +1,24 @@
+import pytest
+
+from farol_core.infrastructure.normalizers.date_normalizer import FlexibleDateNormalizer
+from farol_core.infrastructure.normalizers.text_cleaner import SoupTextCleaner
+from farol_core.infrastructure.normalizers.url_normalizer import SimpleUrlNormalizer
+
+# Normalizadores com construtor padrão são imutáveis/sem estado: uma
+# instância por sessão basta para todos os testes; casos que precisam de
+# argumentos específicos constroem a sua própria localmente.
+
+
+@pytest.fixture(scope="session")
+def url_normalizer() -> SimpleUrlNormalizer:
+    return SimpleUrlNormalizer()
+
+
+@pytest.fixture(scope="session")
+def date_normalizer() -> FlexibleDateNormalizer:
+    return FlexibleDateNormalizer()
+
+
+@pytest.fixture(scope="session")
+def text_cleaner() -> SoupTextCleaner:
+    return SoupTextCleaner()
@@ -1,12 +1,14 @@
-from farol_core.infrastructure.normalizers.text_cleaner import SoupTextCleaner
+import pytest
 
+from farol_core.infrastructure.normalizers.text_cleaner import SoupTextCleaner
 
-def test_clean_html_to_text_removes_tags_and_whitespace() -> None:
-    cleaner = SoupTextCleaner()
 
+def test_clean_html_to_text_removes_tags_and_whitespace(
+    text_cleaner: SoupTextCleaner,
+) -> None:
     raw_html = "<div>Olá <strong>mundo</strong>!<script>alert('x')</script></div>"
 
-    assert cleaner.clean_html_to_text(raw_html) == "Olá mundo!"
+    assert text_cleaner.clean_html_to_text(raw_html) == "Olá mundo!"
 
 
 def test_sanitize_html_preserves_allowed_tags_and_strips_others() -> None:
@@ -20,3 +22,29 @@ def test_sanitize_html_preserves_allowed_tags_and_strips_others() -> None:
     assert "onclick" not in sanitized
     assert "javascript" not in sanitized
     assert sanitized.startswith("<p>")
+
+
+def test_lexbor_cleaner_matches_soup_text_output(
+    text_cleaner: SoupTextCleaner,
+) -> None:
+    # O backend em C é opcional: sem selectolax instalado o teste de
+    # conformidade é pulado em vez de falhar.
+    pytest.importorskip("selectolax.lexbor")
+    from farol_core.infrastructure.normalizers.lexbor_text_cleaner import (
+        LexborTextCleaner,
+    )
+
+    cleaner = LexborTextCleaner()
+    raw_html = "<div>Olá <strong>mundo</strong>!<script>alert('x')</script></div>"
+
+    assert cleaner.clean_html_to_text(raw_html) == text_cleaner.clean_html_to_text(
+        raw_html
+    )
+
+    sanitized = cleaner.sanitize_html("<p>ok</p><iframe src='x'></iframe>")
+    assert "iframe" not in sanitized
+    assert "ok" in sanitized
+
+    # Texto solto fora de qualquer elemento deve sobreviver à sanitização.
+    assert "Olá" in cleaner.sanitize_html("Olá <b>mundo</b>")
+    assert cleaner.sanitize_html("apenas texto") == "apenas texto"
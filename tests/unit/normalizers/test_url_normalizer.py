@@ -1,27 +1,59 @@
-from farol_core.infrastructure.normalizers.url_normalizer import SimpleUrlNormalizer
-
-
-def test_to_absolute_uses_base_url() -> None:
-    normalizer = SimpleUrlNormalizer()
-
-    result = normalizer.to_absolute("/path/article", "https://example.com/news/")
-
-    assert result == "https://example.com/path/article"
-
-
-def test_to_absolute_uses_default_base_url_when_not_provided() -> None:
-    normalizer = SimpleUrlNormalizer(default_base_url="https://example.com/base/")
-
-    result = normalizer.to_absolute("./relative")
-
-    assert result == "https://example.com/relative"
+import pytest
 
+from farol_core.infrastructure.normalizers.url_normalizer import SimpleUrlNormalizer
 
-def test_to_absolute_rejects_empty_input() -> None:
-    normalizer = SimpleUrlNormalizer()
 
+@pytest.mark.parametrize(
+    ("url", "base_url", "default_base_url", "expected"),
+    [
+        (
+            "/path/article",
+            "https://example.com/news/",
+            None,
+            "https://example.com/path/article",
+        ),
+        ("./relative", None, "https://example.com/base/", "https://example.com/relative"),
+        (
+            "https://Example.COM:443/Path?q=1",
+            None,
+            None,
+            "https://example.com/Path?q=1",
+        ),
+        (
+            "/x",
+            "https://EXAMPLE.com/",
+            None,
+            "https://example.com/x",
+        ),
+    ],
+    ids=[
+        "base-explicita",
+        "base-padrao",
+        "canonicalizacao",
+        "canonicalizacao-via-base",
+    ],
+)
+def test_to_absolute(
+    url: str,
+    base_url: str | None,
+    default_base_url: str | None,
+    expected: str,
+    url_normalizer: SimpleUrlNormalizer,
+) -> None:
+    normalizer = (
+        SimpleUrlNormalizer(default_base_url=default_base_url)
+        if default_base_url
+        else url_normalizer
+    )
+
+    assert normalizer.to_absolute(url, base_url) == expected
+
+
+def test_to_absolute_rejects_empty_input(
+    url_normalizer: SimpleUrlNormalizer,
+) -> None:
     try:
-        normalizer.to_absolute(" ")
+        url_normalizer.to_absolute(" ")
     except ValueError:
         pass
     else:  # pragma: no cover - segurança
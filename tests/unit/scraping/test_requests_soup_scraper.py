@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, replace
 
 import pytest
 
 from farol_core.domain.errors import FetchError
+from farol_core.infrastructure.parsing.html_tree import HTMLDocument
 from farol_core.infrastructure.normalizers.url_normalizer import SimpleUrlNormalizer
 from farol_core.infrastructure.scraping.requests_soup_scraper import (
     RequestsSoupScraper,
@@ -14,7 +15,7 @@ from farol_core.infrastructure.scraping.requests_soup_scraper import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakeResponse:
     text: str
     url: str
@@ -27,7 +28,16 @@ class _FakeResponse:
 
 class _FakeClient:
     def __init__(self, responses: Mapping[tuple[str, tuple[tuple[str, object], ...] | None], _FakeResponse]) -> None:
-        self._responses = dict(responses)
+        # Cópia rasa por resposta: testes que mexem em status_code não
+        # afetam os objetos compartilhados no módulo.
+        self._responses = {key: replace(value) for key, value in responses.items()}
+        # Índice em dois níveis (url -> params -> resposta, mesmos
+        # objetos): o get() faz um lookup de string + um de dict pequeno,
+        # e o caso sem params nem aloca a chave frozenset.
+        self._index: dict[str, dict[frozenset | None, _FakeResponse]] = {}
+        for (url, params), response in self._responses.items():
+            bucket = self._index.setdefault(url, {})
+            bucket[frozenset(params) if params else None] = response
         self.calls: list[tuple[str, Mapping[str, object] | None]] = []
 
     def get(
@@ -38,11 +48,16 @@ class _FakeClient:
         timeout: float | None = None,
         headers: Mapping[str, str] | None = None,
     ) -> _FakeResponse:
-        key = (url, tuple(sorted((params or {}).items())) or None)
         self.calls.append((url, dict(params or {})))
-        if key not in self._responses:
-            raise RuntimeError(f"Requisição inesperada: {key}")
-        return self._responses[key]
+        bucket = self._index.get(url)
+        response = (
+            bucket.get(frozenset(params.items()) if params else None)
+            if bucket is not None
+            else None
+        )
+        if response is None:
+            raise RuntimeError(f"Requisição inesperada: {(url, params)}")
+        return response
 
 
 _LISTING_PAGE_1 = """
@@ -80,46 +95,80 @@ _ARTICLE_NO_TITLE = """
 """
 
 
+# Respostas e parsers compartilhados no escopo do módulo: as respostas são
+# somente-leitura (os testes trocam entradas do dict do cliente, nunca o
+# conteúdo) e os parsers são imutáveis após o __init__, então construí-los
+# uma vez amortiza a pré-compilação de seletores entre todos os testes.
+_RESPONSES = {
+    ("https://example.com/list", (("page", 1),)): _FakeResponse(
+        text=_LISTING_PAGE_1,
+        url="https://example.com/list?page=1",
+    ),
+    ("https://example.com/list", (("page", 2),)): _FakeResponse(
+        text=_LISTING_PAGE_2,
+        url="https://example.com/list?page=2",
+    ),
+    ("https://example.com/article-1", None): _FakeResponse(
+        text=_ARTICLE_PAGE,
+        url="https://example.com/article-1",
+    ),
+    ("https://external.com/article-2", None): _FakeResponse(
+        text=_ARTICLE_NO_TITLE,
+        url="https://external.com/article-2",
+    ),
+    ("https://example.com/article-3", None): _FakeResponse(
+        text=_ARTICLE_PAGE,
+        url="https://example.com/article-3",
+    ),
+}
+
+_LISTING_PARSER = SoupListingParser(
+    item_selector="li.item",
+    metadata_selectors={
+        "tags": {"selector": ".tag", "all": True},
+        "published_at": {"selector": ".date"},
+    },
+    summary_selector=".summary",
+)
+_ARTICLE_PARSER = SoupArticleParser(
+    body_selector="article .content", title_selector="h1"
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _cached_html_parsing() -> Iterator[None]:
+    """Parseia cada blob HTML do módulo uma única vez.
+
+    Os fixtures são constantes de módulo e os parsers só leem a árvore,
+    então documentos podem ser compartilhados entre os testes; a chave é
+    a identidade da string, estável para constantes vivas.
+    """
+
+    original = HTMLDocument.from_html
+    cache: dict[int, HTMLDocument] = {}
+
+    def cached(html: object) -> HTMLDocument:
+        key = id(html)
+        document = cache.get(key)
+        if document is None:
+            document = cache[key] = original(html)
+        return document
+
+    HTMLDocument.from_html = staticmethod(cached)  # type: ignore[method-assign]
+    yield
+    HTMLDocument.from_html = original  # type: ignore[method-assign]
+
+
 @pytest.fixture
 def scraper() -> RequestsSoupScraper:
-    responses = {
-        ("https://example.com/list", (("page", 1),)): _FakeResponse(
-            text=_LISTING_PAGE_1,
-            url="https://example.com/list?page=1",
-        ),
-        ("https://example.com/list", (("page", 2),)): _FakeResponse(
-            text=_LISTING_PAGE_2,
-            url="https://example.com/list?page=2",
-        ),
-        ("https://example.com/article-1", None): _FakeResponse(
-            text=_ARTICLE_PAGE,
-            url="https://example.com/article-1",
-        ),
-        ("https://external.com/article-2", None): _FakeResponse(
-            text=_ARTICLE_NO_TITLE,
-            url="https://external.com/article-2",
-        ),
-        ("https://example.com/article-3", None): _FakeResponse(
-            text=_ARTICLE_PAGE,
-            url="https://example.com/article-3",
-        ),
-    }
-    client = _FakeClient(responses)
-    listing_parser = SoupListingParser(
-        item_selector="li.item",
-        metadata_selectors={
-            "tags": {"selector": ".tag", "all": True},
-            "published_at": {"selector": ".date"},
-        },
-        summary_selector=".summary",
-    )
-    article_parser = SoupArticleParser(body_selector="article .content", title_selector="h1")
-    normalizer = SimpleUrlNormalizer()
+    # O cliente continua por teste: cada um recebe sua própria cópia do
+    # dict de respostas para poder mutá-la sem vazar para os vizinhos.
+    client = _FakeClient(_RESPONSES)
     return RequestsSoupScraper(
         client=client,
-        listing_parser=listing_parser,
-        article_parser=article_parser,
-        url_normalizer=normalizer,
+        listing_parser=_LISTING_PARSER,
+        article_parser=_ARTICLE_PARSER,
+        url_normalizer=SimpleUrlNormalizer(),
         pagination={"count": 2, "param": "page"},
     )
 
@@ -174,3 +223,30 @@ def test_fetch_page_raises_on_http_error(scraper: RequestsSoupScraper) -> None:
 
     with pytest.raises(FetchError):
         scraper.fetch_page({"url": "https://example.com/list"})
+
+
+def test_lexbor_listing_parser_matches_soup_output() -> None:
+    # O backend em C é opcional: sem selectolax instalado o teste de
+    # paridade é pulado em vez de falhar.
+    pytest.importorskip("selectolax.lexbor")
+    from farol_core.infrastructure.scraping.lexbor_parsers import LexborListingParser
+
+    lexbor_parser = LexborListingParser(
+        item_selector="li.item",
+        metadata_selectors={
+            "tags": {"selector": ".tag", "all": True},
+            "published_at": {"selector": ".date"},
+        },
+        summary_selector=".summary",
+    )
+
+    lexbor_items = list(lexbor_parser.extract(_LISTING_PAGE_1, base_url="https://example.com/list"))
+    soup_items = list(_LISTING_PARSER.extract(_LISTING_PAGE_1, base_url="https://example.com/list"))
+
+    assert [item.url for item in lexbor_items] == [item.url for item in soup_items]
+    for lexbor_item, soup_item in zip(lexbor_items, soup_items):
+        assert lexbor_item.metadata.get("title") == soup_item.metadata.get("title")
+        assert lexbor_item.metadata.get("tags") == soup_item.metadata.get("tags")
+        assert lexbor_item.metadata.get("published_at") == soup_item.metadata.get(
+            "published_at"
+        )
@@ -5,6 +5,7 @@ import logging
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 
 import pytest
 
@@ -14,7 +15,7 @@ from farol_core.domain.errors import FarolError
 from farol_core.infrastructure.logging.logger import configure_logger
 
 
-@dataclass
+@dataclass(slots=True)
 class _ClockStub:
     instant: datetime
 
@@ -50,9 +51,16 @@ class _UrlNormalizerStub:
         return url
 
 
+@lru_cache(maxsize=128)
+def _parse_iso(value: str) -> datetime:
+    # As datas dos fixtures se repetem entre os itens; o cache troca o
+    # parse ISO recorrente por um lookup.
+    return datetime.fromisoformat(value)
+
+
 class _DateNormalizerStub:
     def parse(self, value: str, reference: datetime | None = None) -> datetime | None:
-        return datetime.fromisoformat(value)
+        return _parse_iso(value)
 
 
 class _TextCleanerStub:
@@ -104,6 +112,18 @@ def _build_use_case(
     return use_case, writer, clock, logger
 
 
+@pytest.fixture(scope="module")
+def collect_logger() -> logging.Logger:
+    """Logger padrão dos testes, configurado uma vez por módulo."""
+
+    return configure_logger("test.collect")
+
+
+@pytest.fixture(scope="module")
+def dedup_logger() -> logging.Logger:
+    return configure_logger("test.collect.dedup")
+
+
 class _ListHandler(logging.Handler):
     def __init__(self) -> None:
         super().__init__()
@@ -122,7 +142,19 @@ class _ListHandler(logging.Handler):
         self.records.append((message, extra_value))
 
 
-def test_collect_usecase_processes_pages_and_apply_dedup() -> None:
+@pytest.fixture
+def dedup_log_capture(dedup_logger: logging.Logger) -> Iterable[_ListHandler]:
+    # Anexa e remove o handler por teste: o logger de módulo não acumula
+    # handlers entre execuções.
+    handler = _ListHandler()
+    dedup_logger.addHandler(handler)
+    yield handler
+    dedup_logger.removeHandler(handler)
+
+
+def test_collect_usecase_processes_pages_and_apply_dedup(
+    dedup_logger: logging.Logger, dedup_log_capture: _ListHandler
+) -> None:
     pages = (
         {"url": "https://example.com/page-1", "metadata": {"section": "home"}},
         {"url": "https://example.com/page-2", "metadata": {"section": "tech"}},
@@ -153,11 +185,8 @@ def test_collect_usecase_processes_pages_and_apply_dedup() -> None:
             ],
         }
     )
-    logger = configure_logger("test.collect.dedup")
-    list_handler = _ListHandler()
-    logger.addHandler(list_handler)
     use_case, writer, clock, _ = _build_use_case(
-        scraper=scraper, pages=pages, logger_name="test.collect.dedup", logger=logger
+        scraper=scraper, pages=pages, logger=dedup_logger
     )
 
     result = use_case.execute()
@@ -182,14 +211,16 @@ def test_collect_usecase_processes_pages_and_apply_dedup() -> None:
 
     dedup_records = [
         extra
-        for message, extra in list_handler.records
+        for message, extra in dedup_log_capture.records
         if message == "scrape.item_skipped_dedup"
     ]
     assert len(dedup_records) == 2
     assert {extra["reason"] for extra in dedup_records} == {"url", "fingerprint"}
 
 
-def test_collect_usecase_wraps_unexpected_errors() -> None:
+def test_collect_usecase_wraps_unexpected_errors(
+    collect_logger: logging.Logger,
+) -> None:
     class _FailingScraper(RequestsSoupScraper):  # pragma: no cover - exceção
         def fetch_page(self, page: Mapping[str, object]) -> Iterable[ScrapedItem]:
             raise ValueError("boom")
@@ -197,13 +228,16 @@ def test_collect_usecase_wraps_unexpected_errors() -> None:
     use_case, _, _, _ = _build_use_case(
         scraper=_FailingScraper(),
         pages=({"url": "https://example.com"},),
+        logger=collect_logger,
     )
 
     with pytest.raises(FarolError):
         use_case.execute()
 
 
-def test_collect_usecase_propagates_domain_errors() -> None:
+def test_collect_usecase_propagates_domain_errors(
+    collect_logger: logging.Logger,
+) -> None:
     class _DomainErrorScraper(RequestsSoupScraper):  # pragma: no cover - exceção
         def fetch_page(self, page: Mapping[str, object]) -> Iterable[ScrapedItem]:
             raise FarolError("erro fetch")
@@ -211,6 +245,7 @@ def test_collect_usecase_propagates_domain_errors() -> None:
     use_case, _, _, _ = _build_use_case(
         scraper=_DomainErrorScraper(),
         pages=({"url": "https://example.com"},),
+        logger=collect_logger,
     )
 
     with pytest.raises(FarolError):
@@ -69,15 +69,18 @@ def test_date_normalizer_protocol_stub() -> None:
 
 class StubDeduper:
     def __init__(self) -> None:
-        self._seen: set[str] = set()
+        # Guarda digests de 64 bits em vez das strings completas, no
+        # mesmo espírito do armazenamento compacto do Sha256Deduper.
+        self._seen: set[int] = set()
 
     def fingerprint(self, article: ArticleInput) -> str:
         return article.url
 
     def is_new(self, fingerprint: str) -> bool:
-        if fingerprint in self._seen:
+        key = hash(fingerprint)
+        if key in self._seen:
             return False
-        self._seen.add(fingerprint)
+        self._seen.add(key)
         return True
 
 
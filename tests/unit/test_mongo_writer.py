@@ -6,6 +6,7 @@ import pytest
 
 from farol_core.domain.contracts import ArticleInput
 from farol_core.domain.errors import WriteError
+from farol_core.infrastructure.db import mongo_writer
 from farol_core.infrastructure.db.mongo_writer import MongoArticleWriter
 
 
@@ -31,12 +32,33 @@ def _build_article() -> ArticleInput:
     )
 
 
+# Esquema fixo do documento persistido: constante compartilhada para a
+# checagem O(1) de chaves antes da comparação valor a valor.
+_EXPECTED_DOCUMENT_KEYS = frozenset(
+    {
+        "url",
+        "portal_name",
+        "title",
+        "summary",
+        "content_html",
+        "content_text",
+        "tags",
+        "published_at_raw",
+        "published_at",
+        "fingerprint",
+        "collected_at",
+        "raw_meta",
+    }
+)
+
+
 def test_to_document_includes_all_expected_fields() -> None:
     writer = MongoArticleWriter(collection=None)
     article = _build_article()
 
     document = writer._to_document(article, "fingerprint-123")
 
+    assert document.keys() == _EXPECTED_DOCUMENT_KEYS
     assert document == {
         "url": article.url,
         "portal_name": article.portal_name,
@@ -53,6 +75,46 @@ def test_to_document_includes_all_expected_fields() -> None:
     }
 
 
+def test_to_document_can_preencode_raw_meta_as_bson() -> None:
+    # bson vem com o pymongo opcional: sem ele o opt-in degrada para o
+    # dict plano e este teste é pulado.
+    bson = pytest.importorskip("bson")
+    writer = MongoArticleWriter(collection=None, encode_raw_meta=True)
+    article = _build_article()
+
+    document = writer._to_document(article, "fingerprint-123")
+
+    assert "raw_meta" not in document
+    assert bson.decode(document["raw_meta_bson"]) == {"section": "home"}
+
+
+def test_to_document_folds_duplicate_content_only_when_opted_in() -> None:
+    text = "Conteúdo"
+    article = ArticleInput(
+        url="https://example.com/artigo",
+        title="Título",
+        portal_name="Portal Exemplo",
+        summary=None,
+        content_html=text,
+        content_text=text,
+        tags=("politica",),
+        published_at_raw=None,
+        published_at=None,
+        collected_at=datetime(2024, 1, 2, 12, 0, 0),
+    )
+
+    # Padrão: o esquema persistido não muda, mesmo com a string repetida.
+    document = MongoArticleWriter(collection=None)._to_document(article, "fp-1")
+    assert document["content_html"] == text
+    assert "content_is_html" not in document
+
+    folding_writer = MongoArticleWriter(collection=None, fold_duplicate_content=True)
+    folded = folding_writer._to_document(article, "fp-1")
+    assert folded["content_html"] is None
+    assert folded["content_is_html"] is True
+    assert folded["content_text"] == text
+
+
 def test_write_returns_inserted_status_when_upserting_new_document() -> None:
     class _CollectionStub:
         def __init__(self) -> None:
@@ -69,7 +131,12 @@ def test_write_returns_inserted_status_when_upserting_new_document() -> None:
 
     assert result.status == "inserted"
     assert result.article_id == "abc123"
-    assert collection.calls[0][0] == {"url": "https://example.com/artigo"}
+    assert collection.calls[0][0] == {
+        "$or": [
+            {"url": "https://example.com/artigo"},
+            {"fingerprint": "fingerprint-123"},
+        ]
+    }
     assert collection.calls[0][2] is True
 
 
@@ -92,20 +159,15 @@ def test_write_returns_updated_status_when_document_exists() -> None:
     assert len(collection.calls) == 1
 
 
-def test_write_fallbacks_to_fingerprint_on_duplicate_key() -> None:
-    class DuplicateKeyError(Exception):
-        """Simula exceção de chave duplicada do Mongo."""
-
+def test_write_resolves_fingerprint_collision_in_single_call() -> None:
     class _CollectionStub:
         def __init__(self) -> None:
             self.calls: list[tuple[dict[str, object], dict[str, object], bool]] = []
-            self._call_count = 0
 
         def update_one(self, filter: dict[str, object], update: dict[str, object], *, upsert: bool):
             self.calls.append((filter, update, upsert))
-            self._call_count += 1
-            if self._call_count == 1:
-                raise DuplicateKeyError("duplicate key")
+            # Simula o casamento pelo fingerprint de um documento com url
+            # diferente: o filtro $or resolve sem segunda ida ao banco.
             return _UpdateResult(upserted_id=None, matched_count=1)
 
     collection = _CollectionStub()
@@ -115,23 +177,222 @@ def test_write_fallbacks_to_fingerprint_on_duplicate_key() -> None:
 
     assert result.status == "updated"
     assert result.article_id is None
-    assert collection.calls[1][0] == {"fingerprint": "fingerprint-123"}
-    assert collection.calls[1][2] is False
+    assert len(collection.calls) == 1
+    assert collection.calls[0][0]["$or"] == [
+        {"url": "https://example.com/artigo"},
+        {"fingerprint": "fingerprint-123"},
+    ]
+
+
+def test_write_many_issues_single_unordered_bulk_write(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _FakeUpdateOne:
+        """Doble de ``pymongo.UpdateOne`` para inspecionar as operações."""
+
+        def __init__(
+            self,
+            filter: dict[str, object],
+            update: dict[str, object],
+            *,
+            upsert: bool = False,
+        ) -> None:
+            self.filter = filter
+            self.update = update
+            self.upsert = upsert
+
+    class _BulkResult:
+        upserted_ids = {0: "abc123"}
 
+    class _CollectionStub:
+        def __init__(self) -> None:
+            self.bulk_calls: list[tuple[list[object], bool]] = []
 
-def test_write_raises_error_when_fingerprint_not_found_after_duplicate() -> None:
-    class DuplicateKeyError(Exception):
-        """Simula exceção de chave duplicada do Mongo."""
+        def bulk_write(self, operations: list[object], *, ordered: bool = True):
+            self.bulk_calls.append((operations, ordered))
+            return _BulkResult()
+
+    monkeypatch.setattr(mongo_writer, "UpdateOne", _FakeUpdateOne)
+    collection = _CollectionStub()
+    writer = MongoArticleWriter(collection)
+    article = _build_article()
+
+    results = writer.write_many([(article, "fp-1"), (article, "fp-2")])
+
+    assert [result.status for result in results] == ["inserted", "updated"]
+    assert results[0].article_id == "abc123"
+    assert len(collection.bulk_calls) == 1
+    operations, ordered = collection.bulk_calls[0]
+    assert ordered is False
+    assert len(operations) == 2
+    # Mesmo filtro $or do write unitário: url mudada com fingerprint já
+    # conhecido atualiza o documento em vez de duplicá-lo.
+    assert operations[0].filter == {
+        "$or": [{"url": article.url}, {"fingerprint": "fp-1"}]
+    }
+    assert operations[0].upsert is True
+
+
+def test_write_many_degrades_to_update_one_without_bulk_support() -> None:
+    class _CollectionStub:
+        def __init__(self) -> None:
+            self.calls: list[dict[str, object]] = []
+
+        def update_one(self, filter: dict[str, object], update: dict[str, object], *, upsert: bool):
+            self.calls.append(filter)
+            return _UpdateResult(upserted_id=None, matched_count=1)
+
+    collection = _CollectionStub()
+    writer = MongoArticleWriter(collection)
+    article = _build_article()
+
+    results = writer.write_many([(article, "fp-1"), (article, "fp-2")])
+
+    assert [result.status for result in results] == ["updated", "updated"]
+    assert len(collection.calls) == 2
+
+
+def test_write_uses_raw_update_command_when_available() -> None:
+    class _DatabaseStub:
+        def __init__(self) -> None:
+            self.commands: list[tuple[str, str, dict[str, object]]] = []
+
+        def command(self, name: str, collection: str, **kwargs: object):
+            self.commands.append((name, collection, kwargs))
+            return {"n": 1, "upserted": [{"index": 0, "_id": "raw123"}]}
+
+    class _CollectionStub:
+        name = "articles"
+
+        def __init__(self) -> None:
+            self.database = _DatabaseStub()
+
+    collection = _CollectionStub()
+    writer = MongoArticleWriter(collection)
+
+    result = writer.write(_build_article(), "fingerprint-123")
+
+    assert result.status == "inserted"
+    assert result.article_id == "raw123"
+    name, target, kwargs = collection.database.commands[0]
+    assert (name, target) == ("update", "articles")
+    assert kwargs["ordered"] is False
+    assert kwargs["updates"][0]["upsert"] is True
+
+
+class _StagingStub:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.inserted: list[dict[str, object]] = []
+        self.pipelines: list[list[dict[str, object]]] = []
+        self.dropped = False
+
+    def insert_many(self, documents: list[dict[str, object]], *, ordered: bool = True):
+        self.inserted.extend(documents)
+
+    def aggregate(self, pipeline: list[dict[str, object]]):
+        self.pipelines.append(pipeline)
+        return []
+
+    def drop(self) -> None:
+        self.dropped = True
+
+
+def test_flush_staging_merges_batch_through_unique_staging() -> None:
+    class _DatabaseStub:
+        def __init__(self) -> None:
+            self.stagings: list[_StagingStub] = []
+
+        def __getitem__(self, name: str) -> _StagingStub:
+            staging = _StagingStub(name)
+            self.stagings.append(staging)
+            return staging
 
     class _CollectionStub:
+        name = "articles"
+
+        def __init__(self) -> None:
+            self.database = _DatabaseStub()
+
+    collection = _CollectionStub()
+    writer = MongoArticleWriter(collection)
+    article = _build_article()
+
+    writer.flush_staging([(article, "fp-1")])
+    writer.flush_staging([(article, "fp-2")])
+
+    assert len(collection.database.stagings) == 2
+    first, second = collection.database.stagings
+    # Nomes únicos por chamada: execuções concorrentes nunca compartilham
+    # a mesma coleção de staging.
+    assert first.name != second.name
+    assert first.name.startswith("articles_staging_")
+    assert [doc["fingerprint"] for doc in first.inserted] == ["fp-1"]
+    merge = first.pipelines[0][0]["$merge"]
+    assert merge["into"] == "articles"
+    assert merge["on"] == "url"
+    assert first.dropped and second.dropped
+
+
+def test_write_many_opts_into_staging_merge() -> None:
+    class _DatabaseStub:
         def __init__(self) -> None:
-            self._call_count = 0
+            self.stagings: list[_StagingStub] = []
+
+        def __getitem__(self, name: str) -> _StagingStub:
+            staging = _StagingStub(name)
+            self.stagings.append(staging)
+            return staging
 
+    class _CollectionStub:
+        name = "articles"
+
+        def __init__(self) -> None:
+            self.database = _DatabaseStub()
+
+        def bulk_write(self, operations: list[object], *, ordered: bool = True):
+            raise AssertionError("staging_merge deveria evitar o bulk_write")
+
+    collection = _CollectionStub()
+    writer = MongoArticleWriter(collection, staging_merge=True)
+    article = _build_article()
+
+    results = writer.write_many([(article, "fp-1"), (article, "fp-2")])
+
+    # $merge não distingue inserções de atualizações: tudo vira "updated".
+    assert [result.status for result in results] == ["updated", "updated"]
+    staging = collection.database.stagings[0]
+    assert [doc["fingerprint"] for doc in staging.inserted] == ["fp-1", "fp-2"]
+    assert staging.pipelines[0][0]["$merge"]["into"] == "articles"
+    assert staging.dropped
+
+
+def test_flush_staging_degrades_to_write_many_without_database() -> None:
+    class _CollectionStub:
+        def __init__(self) -> None:
+            self.calls: list[dict[str, object]] = []
+
+        def update_one(self, filter: dict[str, object], update: dict[str, object], *, upsert: bool):
+            self.calls.append(filter)
+            return _UpdateResult(upserted_id=None, matched_count=1)
+
+    collection = _CollectionStub()
+    writer = MongoArticleWriter(collection)
+
+    writer.flush_staging([(_build_article(), "fp-1")])
+
+    assert len(collection.calls) == 1
+
+
+def test_write_wraps_remaining_duplicate_key_in_write_error() -> None:
+    class DuplicateKeyError(Exception):
+        """Simula exceção de chave duplicada do Mongo."""
+
+    class _CollectionStub:
         def update_one(self, filter: dict[str, object], update: dict[str, object], *, upsert: bool):
-            self._call_count += 1
-            if self._call_count == 1:
-                raise DuplicateKeyError("duplicate key")
-            return _UpdateResult(upserted_id=None, matched_count=0)
+            # url e fingerprint apontando para documentos distintos: o
+            # índice único ainda rejeita e o writer encapsula o erro.
+            raise DuplicateKeyError("duplicate key")
 
     writer = MongoArticleWriter(_CollectionStub())
 
@@ -35,6 +35,25 @@ def test_normalizer_applies_defaults_and_metadata() -> None:
     assert "normalized_at" in normalized.metadata
 
 
+def test_normalize_many_shares_a_single_timestamp() -> None:
+    articles = [
+        RawArticle(
+            url=f"https://example.com/{index}",
+            title=f"Título {index}",
+            body="Conteúdo",
+            metadata={},
+        )
+        for index in range(3)
+    ]
+    normalizer = SimpleNormalizer()
+
+    normalized = normalizer.normalize_many(articles)
+
+    timestamps = {item.metadata["normalized_at"] for item in normalized}
+    assert len(timestamps) == 1
+    assert len({item.collected_at for item in normalized}) == 1
+
+
 def test_normalizer_raises_without_body() -> None:
     article = RawArticle(
         url="https://example.com",